@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Marketplace catalog index
+
+Builds a single JSON index with one entry per plugin and skill (name, path,
+content hash and frontmatter summary) so tools can load the whole catalog with
+one file read, and compares two indexes to report exactly what changed.
+
+Usage:
+    python -m skill_evals.catalog build [--output PATH]
+    python -m skill_evals.catalog diff OLD.json NEW.json [--json]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+from .marketplace import REPO_ROOT, SKILL_FILE, discover, parse_frontmatter
+
+# Bump when the catalog layout changes; older files are rebuilt from scratch
+CATALOG_VERSION = 1
+
+CATALOG_NAME = ".skill-catalog.json"
+SUMMARY_FIELDS = ("name", "description", "user-invocable", "disable-model-invocation", "allowed-tools", "model")
+
+
+def skill_files(skill_dir: Path) -> list[Path]:
+    return sorted(p for p in skill_dir.rglob("*") if p.is_file() and "__pycache__" not in p.parts)
+
+
+def stat_key(files: list[Path], base: Path) -> str:
+    """Cheap change signature from paths, sizes and mtimes."""
+    digest = hashlib.sha256()
+    for path in files:
+        st = path.stat()
+        digest.update(f"{path.relative_to(base).as_posix()}:{st.st_size}:{st.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def content_hash(files: list[Path], base: Path) -> str:
+    digest = hashlib.sha256()
+    for path in files:
+        digest.update(path.relative_to(base).as_posix().encode() + b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def skill_entry(skill_dir: Path, plugin: str, repo_root: Path, previous: dict | None) -> dict:
+    """Build a skill entry, reusing the previous one if no file changed."""
+    files = skill_files(skill_dir)
+    signature = stat_key(files, skill_dir)
+    if previous and previous.get("stat") == signature:
+        return previous
+
+    text = (skill_dir / SKILL_FILE).read_text(errors="replace") if (skill_dir / SKILL_FILE).is_file() else ""
+    frontmatter, _ = parse_frontmatter(text)
+    return {
+        "name": (frontmatter or {}).get("name", skill_dir.name),
+        "plugin": plugin,
+        "path": skill_dir.relative_to(repo_root).as_posix(),
+        "hash": content_hash(files, skill_dir),
+        "stat": signature,
+        "frontmatter": {k: v for k, v in (frontmatter or {}).items() if k in SUMMARY_FIELDS},
+    }
+
+
+def load_index(path: Path) -> dict | None:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+    return data if data.get("version") == CATALOG_VERSION else None
+
+
+def build_catalog(repo_root: Path = REPO_ROOT, previous: dict | None = None) -> dict:
+    """Build the catalog, only re-hashing skills whose files changed since `previous`."""
+    repo_root = repo_root.resolve()
+    marketplace, plugins = discover(repo_root)
+    old_skills = {s["path"]: s for s in (previous or {}).get("skills", [])}
+
+    plugin_entries, skill_entries = [], []
+    for plugin in plugins:
+        if plugin.entry is None:
+            continue
+        skills = [skill_entry(s.path, plugin.name, repo_root, old_skills.get(s.path.relative_to(repo_root).as_posix()))
+                  for s in plugin.skills]
+        digest = hashlib.sha256(json.dumps([plugin.entry, plugin.manifest], sort_keys=True).encode())
+        for skill in skills:
+            digest.update(skill["hash"].encode())
+        plugin_entries.append({
+            "name": plugin.entry.get("name"),
+            "directory": plugin.name,
+            "path": plugin.path.relative_to(repo_root).as_posix(),
+            "version": (plugin.manifest or {}).get("version", plugin.entry.get("version")),
+            "description": plugin.entry.get("description"),
+            "hash": digest.hexdigest(),
+            "skills": [s["name"] for s in skills],
+        })
+        skill_entries.extend(skills)
+
+    return {
+        "version": CATALOG_VERSION,
+        "marketplace": {
+            "name": (marketplace or {}).get("name"),
+            "version": (marketplace or {}).get("metadata", {}).get("version"),
+        },
+        "plugins": plugin_entries,
+        "skills": skill_entries,
+    }
+
+
+def write_catalog(catalog: dict, path: Path) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".catalog-")
+    with os.fdopen(fd, "w") as f:
+        f.write(json.dumps(catalog, indent=2, sort_keys=True) + "\n")
+    os.replace(tmp, path)
+
+
+def diff_catalogs(old: dict | None, new: dict) -> dict:
+    """Compare two catalogs by content hash."""
+    def keyed(catalog: dict | None, kind: str, key: str) -> dict:
+        return {e[key]: e for e in (catalog or {}).get(kind, [])}
+
+    changes = {}
+    for kind, key in (("plugins", "name"), ("skills", "path")):
+        before, after = keyed(old, kind, key), keyed(new, kind, key)
+        changes[kind] = {
+            "added": sorted(k for k in after if k not in before),
+            "removed": sorted(k for k in before if k not in after),
+            "changed": sorted(k for k in after if k in before and after[k]["hash"] != before[k]["hash"]),
+        }
+    return changes
+
+
+def print_diff(changes: dict) -> None:
+    labels = {"added": "Added", "removed": "Removed", "changed": "Changed"}
+    if not any(v for kind in changes.values() for v in kind.values()):
+        print("No plugin or skill changes.")
+        return
+    for kind in ("plugins", "skills"):
+        for status, label in labels.items():
+            items = changes[kind][status]
+            if items:
+                print(f"{label} {kind}:")
+                for item in items:
+                    print(f"    {item}")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Build or compare the marketplace catalog index")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Build or incrementally update the catalog")
+    build.add_argument("--repo-root", type=Path, default=REPO_ROOT, help="Marketplace root (default: repo root)")
+    build.add_argument("--output", "-o", type=Path, help=f"Output file (default: <repo-root>/{CATALOG_NAME})")
+    diff = sub.add_parser("diff", help="Report plugins and skills that changed between two catalogs")
+    diff.add_argument("old", type=Path)
+    diff.add_argument("new", type=Path)
+    diff.add_argument("--json", action="store_true", help="Print a machine-readable report")
+    diff.add_argument("--added-plugins", action="store_true", help="Only print names of added plugins, one per line")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        output = args.output or args.repo_root / CATALOG_NAME
+        catalog = build_catalog(args.repo_root, load_index(output))
+        write_catalog(catalog, output)
+        print(f"Catalog: {len(catalog['plugins'])} plugin(s), {len(catalog['skills'])} skill(s) -> {output}")
+        return
+
+    new = load_index(args.new)
+    if new is None:
+        print(f"Error: {args.new} is not a version {CATALOG_VERSION} catalog")
+        sys.exit(1)
+    changes = diff_catalogs(load_index(args.old), new)
+    if args.added_plugins:
+        for name in changes["plugins"]["added"]:
+            print(name)
+    elif args.json:
+        print(json.dumps(changes, indent=2))
+    else:
+        print_diff(changes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Skill context-footprint profiler
+
+Estimates how many prompt tokens each plugin and skill adds to every session
+(always-loaded frontmatter) versus only when invoked (SKILL.md body and
+reference files), totals them per install profile, and enforces budgets.
+
+Usage:
+    uv run skill-footprint [--budgets footprint-budgets.yaml] [--json]
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import yaml
+
+from .marketplace import EVALS_DIR, REPO_ROOT, SKILL_FILE, discover, parse_frontmatter
+
+# Rough average for English prose and code; good enough for budgeting
+DEFAULT_CHARS_PER_TOKEN = 4.0
+
+
+@dataclass
+class SkillFootprint:
+    name: str
+    plugin: str
+    always_loaded: int  # Tokens for name + description, injected into every session
+    on_demand: int  # Tokens for the SKILL.md body and references, loaded when invoked
+    references: int = 0
+    model_invocable: bool = True
+
+
+@dataclass
+class PluginFootprint:
+    name: str  # Marketplace plugin name
+    directory: str
+    skills: list[SkillFootprint] = field(default_factory=list)
+    commands_always_loaded: int = 0
+
+    @property
+    def always_loaded(self) -> int:
+        return sum(s.always_loaded for s in self.skills) + self.commands_always_loaded
+
+    @property
+    def on_demand(self) -> int:
+        return sum(s.on_demand for s in self.skills)
+
+
+def estimate_tokens(text: str, chars_per_token: float = DEFAULT_CHARS_PER_TOKEN) -> int:
+    return round(len(text) / chars_per_token)
+
+
+def is_true(value: str | None) -> bool:
+    return (value or "").strip().lower() == "true"
+
+
+def profile_skill(skill_dir: Path, plugin: str, chars_per_token: float) -> SkillFootprint:
+    """Measure one skill's always-loaded and on-demand token footprint."""
+    skill_file = skill_dir / SKILL_FILE
+    text = skill_file.read_text(errors="replace") if skill_file.is_file() else ""
+    frontmatter, body = parse_frontmatter(text)
+    frontmatter = frontmatter or {}
+
+    # Skills with model invocation disabled are not advertised to the model
+    model_invocable = not is_true(frontmatter.get("disable-model-invocation"))
+    summary = f"{frontmatter.get('name', skill_dir.name)}: {frontmatter.get('description', '')}"
+    always_loaded = estimate_tokens(summary, chars_per_token) if model_invocable else 0
+
+    references = 0
+    refs_dir = skill_dir / "references"
+    if refs_dir.is_dir():
+        for ref in sorted(refs_dir.rglob("*")):
+            if ref.is_file() and not ref.name.startswith("."):
+                references += estimate_tokens(ref.read_text(errors="replace"), chars_per_token)
+
+    return SkillFootprint(
+        name=frontmatter.get("name", skill_dir.name),
+        plugin=plugin,
+        always_loaded=always_loaded,
+        on_demand=estimate_tokens(body, chars_per_token) + references,
+        references=references,
+        model_invocable=model_invocable,
+    )
+
+
+def profile_marketplace(repo_root: Path = REPO_ROOT, chars_per_token: float = DEFAULT_CHARS_PER_TOKEN) -> list[PluginFootprint]:
+    """Profile every plugin listed in marketplace.json."""
+    _, plugins = discover(repo_root)
+    footprints = []
+    for plugin in plugins:
+        if plugin.entry is None:
+            continue
+        footprint = PluginFootprint(name=plugin.entry.get("name", plugin.name), directory=plugin.name)
+        footprint.skills = [profile_skill(s.path, plugin.name, chars_per_token) for s in plugin.skills]
+        commands_dir = plugin.path / ((plugin.manifest or {}).get("commands") or "commands")
+        if commands_dir.is_dir():
+            for command in sorted(commands_dir.glob("*.md")):
+                fields, _ = parse_frontmatter(command.read_text(errors="replace"))
+                description = (fields or {}).get("description", "")
+                footprint.commands_always_loaded += estimate_tokens(f"{command.stem}: {description}", chars_per_token)
+        footprints.append(footprint)
+    return footprints
+
+
+def resolve_profiles(config: dict, plugins: list[PluginFootprint]) -> dict[str, list[PluginFootprint]]:
+    """Map each install profile to its plugins; profiles list plugin directory names."""
+    profiles = {"all": plugins}
+    by_dir = {p.directory: p for p in plugins}
+    for name, members in (config.get("profiles") or {}).items():
+        unknown = [m for m in members if m not in by_dir]
+        if unknown:
+            raise ValueError(f"Profile '{name}' references unknown plugin(s): {', '.join(unknown)}")
+        profiles[name] = [by_dir[m] for m in members]
+    return profiles
+
+
+def check_budgets(config: dict, plugins: list[PluginFootprint], profiles: dict[str, list[PluginFootprint]]) -> list[str]:
+    """Return a message for every budget that is exceeded."""
+    budgets = config.get("budgets") or {}
+    violations = []
+    skill_budget = budgets.get("skill_always_loaded")
+    skill_on_demand = budgets.get("skill_on_demand")
+    plugin_budget = budgets.get("plugin_always_loaded")
+    profile_budget = budgets.get("profile_always_loaded")
+    profile_overrides = budgets.get("profiles") or {}
+
+    for plugin in plugins:
+        for skill in plugin.skills:
+            if skill_budget is not None and skill.always_loaded > skill_budget:
+                violations.append(f"skill {skill.name}: always-loaded {skill.always_loaded} > {skill_budget} tokens")
+            if skill_on_demand is not None and skill.on_demand > skill_on_demand:
+                violations.append(f"skill {skill.name}: on-demand {skill.on_demand} > {skill_on_demand} tokens")
+        if plugin_budget is not None and plugin.always_loaded > plugin_budget:
+            violations.append(f"plugin {plugin.directory}: always-loaded {plugin.always_loaded} > {plugin_budget} tokens")
+    for name, members in profiles.items():
+        limit = profile_overrides.get(name, profile_budget)
+        total = sum(p.always_loaded for p in members)
+        if limit is not None and total > limit:
+            violations.append(f"profile {name}: always-loaded {total} > {limit} tokens")
+    return violations
+
+
+def print_report(plugins: list[PluginFootprint], profiles: dict[str, list[PluginFootprint]], violations: list[str]) -> None:
+    print(f"{'Plugin / skill':<44} {'Always':>8} {'On-demand':>10}")
+    print("-" * 64)
+    for plugin in plugins:
+        print(f"{plugin.directory:<44} {plugin.always_loaded:>8} {plugin.on_demand:>10}")
+        for skill in plugin.skills:
+            label = f"  {skill.name}" + ("" if skill.model_invocable else " (user-only)")
+            print(f"{label:<44} {skill.always_loaded:>8} {skill.on_demand:>10}")
+        if plugin.commands_always_loaded:
+            print(f"{'  (commands)':<44} {plugin.commands_always_loaded:>8} {'':>10}")
+
+    print(f"\n{'Install profile':<44} {'Always':>8} {'On-demand':>10}")
+    print("-" * 64)
+    for name, members in profiles.items():
+        print(f"{name:<44} {sum(p.always_loaded for p in members):>8} {sum(p.on_demand for p in members):>10}")
+
+    print(f"\n{'=' * 50}")
+    if violations:
+        print(f"FAILED: {len(violations)} budget(s) exceeded:")
+        for v in violations:
+            print(f"  - {v}")
+    else:
+        print("All footprint budgets met.")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Profile the prompt-token footprint of marketplace skills")
+    parser.add_argument(
+        "--budgets",
+        default="footprint-budgets.yaml",
+        help="Budget/profile YAML file, relative to evals/ (default: footprint-budgets.yaml)",
+    )
+    parser.add_argument("--repo-root", type=Path, default=REPO_ROOT, help="Marketplace root (default: repo root)")
+    parser.add_argument("--chars-per-token", type=float, default=DEFAULT_CHARS_PER_TOKEN)
+    parser.add_argument("--json", action="store_true", help="Print a machine-readable report")
+    args = parser.parse_args()
+
+    budgets_file = Path(args.budgets)
+    if not budgets_file.is_absolute():
+        budgets_file = EVALS_DIR / budgets_file
+    config = {}
+    if budgets_file.exists():
+        with open(budgets_file) as f:
+            config = yaml.safe_load(f) or {}
+
+    plugins = profile_marketplace(args.repo_root, args.chars_per_token)
+    try:
+        profiles = resolve_profiles(config, plugins)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    violations = check_budgets(config, plugins, profiles)
+
+    if args.json:
+        print(json.dumps({
+            "plugins": [
+                {**asdict(p), "always_loaded": p.always_loaded, "on_demand": p.on_demand} for p in plugins
+            ],
+            "profiles": {
+                name: {
+                    "plugins": [p.directory for p in members],
+                    "always_loaded": sum(p.always_loaded for p in members),
+                    "on_demand": sum(p.on_demand for p in members),
+                }
+                for name, members in profiles.items()
+            },
+            "violations": violations,
+        }, indent=2))
+    else:
+        print_report(plugins, profiles, violations)
+
+    sys.exit(1 if violations else 0)
+
+
+if __name__ == "__main__":
+    main()
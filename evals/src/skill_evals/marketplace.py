@@ -0,0 +1,105 @@
+"""Discovery of plugins and skills from a marketplace checkout."""
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# evals/ directory
+EVALS_DIR = Path(__file__).resolve().parent.parent.parent
+
+# Repository root (parent of evals/)
+REPO_ROOT = EVALS_DIR.parent
+
+MARKETPLACE_JSON = Path(".claude-plugin") / "marketplace.json"
+PLUGIN_JSON = Path(".claude-plugin") / "plugin.json"
+SKILL_FILE = "SKILL.md"
+
+_KEY_RE = re.compile(r"^([A-Za-z0-9_-]+):(.*)$")
+
+
+@dataclass
+class Skill:
+    name: str  # Directory name
+    path: Path
+    plugin: str  # Plugin directory name
+
+
+@dataclass
+class Plugin:
+    name: str  # Directory name under plugins/
+    path: Path
+    entry: dict | None = None  # Entry in marketplace.json, if listed
+    manifest: dict | None = None  # Parsed plugin.json, if present
+    skills: list[Skill] = field(default_factory=list)
+
+
+def load_json(path: Path) -> dict | None:
+    """Load a JSON file, returning None if it is missing or invalid."""
+    try:
+        return json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def parse_frontmatter(text: str) -> tuple[dict[str, str] | None, str]:
+    """Split SKILL.md text into (frontmatter fields, body).
+
+    Only top-level keys are read; folded (`>`) and literal (`|`) block values are
+    joined from their indented continuation lines. Returns None for the
+    frontmatter when the file does not start with a `---` block.
+    """
+    lines = text.splitlines()
+    if not lines or lines[0].strip() != "---":
+        return None, text
+    try:
+        end = next(i for i, line in enumerate(lines[1:], 1) if line.strip() == "---")
+    except StopIteration:
+        end = len(lines)
+
+    fields: dict[str, str] = {}
+    key = None
+    block: list[str] = []
+    for line in lines[1:end]:
+        match = _KEY_RE.match(line)
+        if match:
+            if key and block:
+                fields[key] = " ".join(block)
+            key, value = match.group(1), match.group(2).strip()
+            block = []
+            if value in (">", "|", ">-", "|-"):
+                fields[key] = ""
+            else:
+                fields[key] = value.strip("\"'")
+                key = None if value else key
+        elif key and line.strip():
+            block.append(line.strip())
+    if key and block:
+        fields[key] = " ".join(block)
+    return fields, "\n".join(lines[end + 1:])
+
+
+def discover(repo_root: Path) -> tuple[dict | None, list[Plugin]]:
+    """Find every plugin under plugins/ and the skills each one ships.
+
+    Plugins are matched to marketplace.json entries by their `source` path.
+    Returns (marketplace.json contents, plugins sorted by directory name).
+    """
+    marketplace = load_json(repo_root / MARKETPLACE_JSON)
+    entries = {}
+    for entry in (marketplace or {}).get("plugins", []):
+        source = (repo_root / entry.get("source", "")).resolve()
+        entries[source] = entry
+
+    plugins = []
+    paths = {p.resolve() for p in (repo_root / "plugins").glob("*") if p.is_dir()} | set(entries)
+    for path in sorted(paths):
+        plugin = Plugin(name=path.name, path=path, entry=entries.get(path), manifest=load_json(path / PLUGIN_JSON))
+        skills_dir = path / ((plugin.manifest or {}).get("skills") or "skills")
+        if skills_dir.is_dir():
+            plugin.skills = [
+                Skill(name=d.name, path=d, plugin=path.name)
+                for d in sorted(skills_dir.iterdir()) if d.is_dir()
+            ]
+        plugins.append(plugin)
+    return marketplace, plugins
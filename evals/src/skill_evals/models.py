@@ -20,3 +20,4 @@ class TestResult:
     expected: str
     actual: Optional[str]
     error: Optional[str] = None
+    timings: Optional[dict[str, float]] = None  # Seconds per phase (startup, first_response, ...)
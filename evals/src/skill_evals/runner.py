@@ -8,9 +8,11 @@ Usage:
 
 import argparse
 import asyncio
+import cProfile
 import json
 import logging
 import random
+import statistics
 import sys
 from pathlib import Path
 
@@ -24,16 +26,12 @@ from claude_agent_sdk import (
 )
 from claude_agent_sdk.types import ToolUseBlock
 
+from .marketplace import EVALS_DIR, REPO_ROOT
 from .models import TestCase, TestResult
+from .tracing import TestTrace, Tracer
 
 logger = logging.getLogger("skill-evals")
 
-# evals/ directory
-EVALS_DIR = Path(__file__).resolve().parent.parent.parent
-
-# Repository root (parent of evals/)
-REPO_ROOT = EVALS_DIR.parent
-
 
 def _is_rate_limit_error(exc: BaseException) -> bool:
     """Check if an exception is a rate limit error from the CLI subprocess."""
@@ -45,8 +43,15 @@ async def run_prompt_and_collect_skills(
     max_turns: int = 5,
     model: str | None = None,
     max_retries: int = 5,
+    trace: TestTrace | None = None,
 ) -> tuple[list[str], list[dict], dict]:
-    """Run a prompt via Agent SDK, return (skills_invoked, tool_calls, result_info)."""
+    """Run a prompt via Agent SDK, return (skills_invoked, tool_calls, result_info).
+
+    Phase marks (spawn, first message, first AssistantMessage, first Skill
+    ToolUseBlock, ResultMessage) and retry backoffs are recorded on `trace`.
+    """
+    if trace is None:
+        trace = Tracer().new_test(prompt[:40])
     logger.debug("Building ClaudeAgentOptions: plugins=%s, max_turns=%d, model=%s, cwd=%s",
                  REPO_ROOT, max_turns, model, REPO_ROOT)
     stderr_lines: list[str] = []
@@ -79,20 +84,25 @@ async def run_prompt_and_collect_skills(
 
             logger.debug("Starting query (attempt %d/%d): %.120s",
                          attempt + 1, max_retries + 1, prompt)
+            trace.mark("spawn")
             async for message in query(prompt=prompt, options=options):
+                trace.mark("first_message")
                 if isinstance(message, AssistantMessage):
+                    trace.mark("first_assistant")
                     for block in message.content:
                         if isinstance(block, ToolUseBlock):
                             tool_calls.append({"tool": block.name, "input": block.input})
                             logger.debug("ToolUseBlock: %s  input=%s", block.name,
                                          json.dumps(block.input)[:200])
                             if block.name == "Skill":
+                                trace.mark("first_skill")
                                 skill_name = block.input.get("skill", "")
                                 if skill_name:
                                     skills_invoked.append(skill_name)
                                     logger.debug("Skill invoked: %s", skill_name)
 
                 elif isinstance(message, ResultMessage):
+                    trace.mark("result")
                     result_info = {
                         "session_id": message.session_id,
                         "total_cost_usd": message.total_cost_usd,
@@ -115,7 +125,9 @@ async def run_prompt_and_collect_skills(
                 logger.warning("Rate limit hit (attempt %d/%d), retrying in %.1fs...",
                                attempt + 1, max_retries + 1, delay)
                 stderr_lines.clear()
+                backoff_start = trace.now()
                 await asyncio.sleep(delay)
+                trace.span("backoff", backoff_start, attempt=attempt + 1, delay=round(delay, 2))
             else:
                 raise
 
@@ -123,8 +135,24 @@ async def run_prompt_and_collect_skills(
     raise RuntimeError("Exhausted retries")
 
 
-async def run_test(test: TestCase, timeout: int = 180, max_retries: int = 5) -> TestResult:
+async def run_test(
+    test: TestCase,
+    timeout: int = 180,
+    max_retries: int = 5,
+    trace: TestTrace | None = None,
+) -> TestResult:
     """Run a single test case and return result."""
+    if trace is None:
+        trace = Tracer().new_test(test.name)
+    start = trace.now()
+    result = await _run_test(test, timeout, max_retries, trace)
+    trace.span("test", start, passed=result.passed, actual=result.actual)
+    result.timings = trace.phases()
+    logger.debug("[%s] Phases (s): %s", test.name, result.timings)
+    return result
+
+
+async def _run_test(test: TestCase, timeout: int, max_retries: int, trace: TestTrace) -> TestResult:
     logger.debug("[%s] Starting test: prompt=%.120s", test.name, test.prompt)
 
     try:
@@ -134,6 +162,7 @@ async def run_test(test: TestCase, timeout: int = 180, max_retries: int = 5) ->
                 max_turns=test.max_turns,
                 model=test.model,
                 max_retries=max_retries,
+                trace=trace,
             ),
             timeout=timeout,
         )
@@ -229,6 +258,7 @@ async def run_and_report(tests: list[TestCase], args: argparse.Namespace) -> Non
     logger.debug("Running %d tests (parallel=%d, timeout=%d)", len(tests), args.parallel, args.timeout)
     results: list[TestResult] = []
     parallel = args.parallel
+    tracer = Tracer()
 
     def print_result(result: TestResult) -> None:
         status = "PASS" if result.passed else "FAIL"
@@ -239,8 +269,11 @@ async def run_and_report(tests: list[TestCase], args: argparse.Namespace) -> Non
         semaphore = asyncio.Semaphore(parallel)
 
         async def bounded(test: TestCase) -> TestResult:
+            trace = tracer.new_test(test.name)
+            queued = trace.now()
             async with semaphore:
-                return await run_test(test, timeout=args.timeout, max_retries=args.max_retries)
+                trace.span("queued", queued)
+                return await run_test(test, timeout=args.timeout, max_retries=args.max_retries, trace=trace)
 
         completed = await asyncio.gather(
             *[bounded(t) for t in tests], return_exceptions=True
@@ -263,7 +296,8 @@ async def run_and_report(tests: list[TestCase], args: argparse.Namespace) -> Non
     else:
         for test in tests:
             print(f"Running: {test.name}...", flush=True)
-            result = await run_test(test, timeout=args.timeout, max_retries=args.max_retries)
+            result = await run_test(test, timeout=args.timeout, max_retries=args.max_retries,
+                                    trace=tracer.new_test(test.name))
             results.append(result)
             status = "PASS" if result.passed else "FAIL"
             print(f"  {status}")
@@ -295,9 +329,59 @@ async def run_and_report(tests: list[TestCase], args: argparse.Namespace) -> Non
     else:
         print(f"\nAll tests passed!")
 
+    print_phase_summary(results)
+
+    if args.trace:
+        tracer.write(args.trace)
+        print(f"\nTrace written to {args.trace} (open in https://ui.perfetto.dev or chrome://tracing)")
+
     sys.exit(0 if passed_threshold else 1)
 
 
+def print_phase_summary(results: list[TestResult]) -> None:
+    """Print median and max seconds per phase across all tests."""
+    by_phase: dict[str, list[float]] = {}
+    for r in results:
+        for phase, seconds in (r.timings or {}).items():
+            by_phase.setdefault(phase, []).append(seconds)
+    if not by_phase:
+        return
+    print(f"\nPhase timings (s):  {'median':>8} {'max':>8}")
+    for phase, values in by_phase.items():
+        print(f"  {phase:<17} {statistics.median(values):>8.2f} {max(values):>8.2f}")
+
+
+def run_profiled(args: argparse.Namespace, tests: list[TestCase]) -> None:
+    """Run the suite under pyinstrument's sampling profiler, or cProfile if it is not installed."""
+    output = Path(args.profile_output)
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        Profiler = None
+        logger.warning("pyinstrument not installed (uv sync --extra profile); falling back to cProfile")
+
+    if Profiler is not None:
+        profiler = Profiler(async_mode="enabled")
+        profiler.start()
+        try:
+            asyncio.run(run_and_report(tests, args))
+        finally:
+            profiler.stop()
+            output = output.with_suffix(".html")
+            output.write_text(profiler.output_html())
+            print(f"Profile written to {output}")
+    else:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            asyncio.run(run_and_report(tests, args))
+        finally:
+            profiler.disable()
+            output = output.with_suffix(".prof")
+            profiler.dump_stats(output)
+            print(f"Profile written to {output} (view with: python -m pstats {output})")
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -311,6 +395,8 @@ Examples:
   skill-evals -j 15                        Run 15 tests in parallel
   skill-evals -f update-skills             Run only matching tests
   skill-evals --threshold 80               Pass if >= 80% of tests pass
+  skill-evals --trace trace.json           Export per-test phase timings (Perfetto)
+  skill-evals --profile                    Run under a sampling profiler
         """,
     )
     parser.add_argument(
@@ -357,6 +443,22 @@ Examples:
         default=95.0,
         help="Minimum pass percentage to exit 0 (default: 95.0)",
     )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        default=None,
+        help="Write per-test phase timings as Chrome-trace/Perfetto JSON to this file",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the runner with pyinstrument (HTML), or cProfile (.prof) if it is not installed",
+    )
+    parser.add_argument(
+        "--profile-output",
+        default="skill-evals-profile",
+        help="Profile output path; the extension is set by the profiler (default: skill-evals-profile)",
+    )
     args = parser.parse_args()
 
     logging.basicConfig(
@@ -381,7 +483,10 @@ Examples:
             print(f"No tests match filter: {args.filter}")
             sys.exit(1)
 
-    asyncio.run(run_and_report(tests, args))
+    if args.profile:
+        run_profiled(args, tests)
+    else:
+        asyncio.run(run_and_report(tests, args))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,99 @@
+"""Per-test phase timing and Chrome-trace (Perfetto) export for the eval runner."""
+
+import json
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Phases derived from consecutive marks within one attempt: (phase, start mark, end mark)
+PHASES = (
+    ("startup", "spawn", "first_message"),  # CLI process start + plugin loading
+    ("first_response", "first_message", "first_assistant"),
+    ("to_skill", "first_assistant", "first_skill"),
+    ("session", "first_skill", "result"),  # Tool execution after the skill was chosen
+)
+
+
+def derive_phases(marks: dict[str, float]) -> list[tuple[str, float, float]]:
+    """Turn one attempt's marks into (phase, start, end) spans."""
+    spans = []
+    for phase, start, end in PHASES:
+        if phase == "session" and "first_skill" not in marks:
+            start = "first_assistant"
+        if start in marks and end in marks:
+            spans.append((phase, marks[start], marks[end]))
+    return spans
+
+
+@dataclass
+class TestTrace:
+    """Timestamps for a single test, in seconds since the tracer started."""
+
+    name: str
+    tid: int
+    clock: Callable[[], float]
+    attempts: list[dict[str, float]] = field(default_factory=list)
+    spans: list[tuple[str, float, float, dict]] = field(default_factory=list)
+
+    def now(self) -> float:
+        return self.clock()
+
+    def mark(self, phase: str) -> None:
+        """Record the first occurrence of a phase mark; "spawn" starts a new attempt."""
+        if phase == "spawn" or not self.attempts:
+            self.attempts.append({})
+        self.attempts[-1].setdefault(phase, self.now())
+
+    def span(self, name: str, start: float, end: float | None = None, **args) -> None:
+        self.spans.append((name, start, self.now() if end is None else end, args))
+
+    def phases(self) -> dict[str, float]:
+        """Seconds spent in each phase of the final attempt, plus backoff/queue totals."""
+        result = {}
+        if self.attempts:
+            result = {phase: round(end - start, 3) for phase, start, end in derive_phases(self.attempts[-1])}
+        for kind in ("queued", "backoff"):
+            total = sum(end - start for name, start, end, _ in self.spans if name == kind)
+            if total:
+                result[kind] = round(total, 3)
+        return result
+
+
+class Tracer:
+    """Collects TestTraces for a whole run and exports them as a Chrome trace."""
+
+    def __init__(self) -> None:
+        self._start = time.perf_counter()
+        self.traces: list[TestTrace] = []
+
+    def clock(self) -> float:
+        return time.perf_counter() - self._start
+
+    def new_test(self, name: str) -> TestTrace:
+        trace = TestTrace(name=name, tid=len(self.traces) + 1, clock=self.clock)
+        self.traces.append(trace)
+        return trace
+
+    def to_chrome_trace(self) -> dict:
+        """Build a Trace Event Format document with one lane per test, viewable in Perfetto."""
+        def us(seconds: float) -> int:
+            return round(seconds * 1e6)
+
+        events = [{"name": "process_name", "ph": "M", "pid": 1, "args": {"name": "skill-evals"}}]
+        for trace in self.traces:
+            base = {"pid": 1, "tid": trace.tid}
+            events.append({**base, "name": "thread_name", "ph": "M", "args": {"name": trace.name}})
+            for name, start, end, args in trace.spans:
+                events.append({**base, "name": name, "ph": "X", "ts": us(start), "dur": us(end - start), "args": args})
+            for attempt, marks in enumerate(trace.attempts, 1):
+                for phase, ts in marks.items():
+                    events.append({**base, "name": phase, "ph": "i", "s": "t", "ts": us(ts), "args": {"attempt": attempt}})
+                for phase, start, end in derive_phases(marks):
+                    events.append({**base, "name": phase, "ph": "X", "ts": us(start), "dur": us(end - start),
+                                   "args": {"attempt": attempt}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_chrome_trace()))
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Skill structure and marketplace validator
+
+Usage:
+    python -m skill_evals.validate --all [--json] [--no-cache]
+    python -m skill_evals.validate plugins/<plugin>/skills/<skill-name> ...
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .marketplace import SKILL_FILE, discover, parse_frontmatter
+
+# Bump when rules change so cached results are not reused
+VALIDATOR_VERSION = 1
+
+CACHE_NAME = ".skill-validate-cache.json"
+KEBAB_CASE = re.compile(r"^[a-z0-9]+(-[a-z0-9]+)*$")
+MIN_BODY_LINES = 10
+MAX_SKILL_LINES = 500
+
+
+def skill_hash(skill_dir: Path) -> str:
+    """Hash everything a skill check depends on: SKILL.md and script modes."""
+    digest = hashlib.sha256(f"v{VALIDATOR_VERSION}".encode())
+    skill_file = skill_dir / SKILL_FILE
+    digest.update(skill_file.read_bytes() if skill_file.is_file() else b"<missing>")
+    scripts = skill_dir / "scripts"
+    if scripts.is_dir():
+        for script in sorted(scripts.iterdir()):
+            if script.is_file():
+                digest.update(f"{script.name}:{os.access(script, os.X_OK)}".encode())
+    return digest.hexdigest()
+
+
+def validate_skill(skill_dir: Path) -> dict:
+    """Validate one skill directory, parsing its frontmatter once."""
+    errors: list[str] = []
+    warnings: list[str] = []
+    result = {"skill": skill_dir.name, "path": str(skill_dir), "name": None, "errors": errors, "warnings": warnings}
+    skill_file = skill_dir / SKILL_FILE
+
+    if not skill_file.is_file():
+        errors.append(f"Missing SKILL.md in {skill_dir}/")
+        return result
+
+    text = skill_file.read_text(errors="replace")
+    frontmatter, body = parse_frontmatter(text)
+    if frontmatter is None:
+        errors.append(f"Missing YAML frontmatter in {skill_file} (must start with ---)")
+        return result
+    if not frontmatter:
+        errors.append(f"Empty YAML frontmatter in {skill_file}")
+        return result
+
+    name = frontmatter.get("name")
+    result["name"] = name
+    if name is None:
+        errors.append(f"Missing 'name' field in {skill_file} frontmatter")
+    elif not KEBAB_CASE.match(name):
+        errors.append(f"'name' must be kebab-case in {skill_file} (got: {name})")
+    elif name != skill_dir.name:
+        warnings.append(f"'name' ({name}) does not match directory name in {skill_dir}/")
+
+    if "description" not in frontmatter:
+        errors.append(f"Missing 'description' field in {skill_file} frontmatter")
+
+    # Counted like validate-skill.sh: every line after the closing ---, and `wc -l` for the file
+    body_lines = body.count("\n") + 1 if body else 0
+    if body_lines < MIN_BODY_LINES:
+        warnings.append(f"SKILL.md body is very short ({body_lines} lines) in {skill_dir}/ — consider adding more detail")
+    total_lines = text.count("\n")
+    if total_lines > MAX_SKILL_LINES:
+        warnings.append(f"SKILL.md is {total_lines} lines in {skill_dir}/ — move detail to references/")
+
+    scripts = skill_dir / "scripts"
+    if scripts.is_dir():
+        for script in sorted(scripts.iterdir()):
+            if script.is_file() and not script.name.startswith(".") and not os.access(script, os.X_OK):
+                warnings.append(f"Script is not executable: {script} — run: chmod +x {script}")
+
+    return result
+
+
+def validate_marketplace(marketplace: dict | None, plugins: list, repo_root: Path) -> dict:
+    """Cross-check marketplace.json against each plugin's plugin.json."""
+    errors: list[str] = []
+    warnings: list[str] = []
+    if marketplace is None:
+        errors.append(f"Missing or invalid .claude-plugin/marketplace.json in {repo_root}")
+        return {"errors": errors, "warnings": warnings}
+
+    for plugin in plugins:
+        rel = os.path.relpath(plugin.path, repo_root)
+        if plugin.entry is None:
+            warnings.append(f"Plugin {rel}/ is not listed in marketplace.json")
+            continue
+        if not plugin.path.is_dir():
+            errors.append(f"marketplace.json source does not exist: {plugin.entry.get('source')}")
+            continue
+        if plugin.manifest is None:
+            errors.append(f"Missing or invalid {rel}/.claude-plugin/plugin.json")
+            continue
+        if plugin.manifest.get("name") != plugin.entry.get("name"):
+            errors.append(f"Plugin name mismatch for {rel}/: marketplace.json has '{plugin.entry.get('name')}', "
+                          f"plugin.json has '{plugin.manifest.get('name')}'")
+        if plugin.manifest.get("version") != plugin.entry.get("version"):
+            warnings.append(f"Version mismatch for {rel}/: marketplace.json has {plugin.entry.get('version')}, "
+                            f"plugin.json has {plugin.manifest.get('version')}")
+        skills_path = plugin.manifest.get("skills")
+        if skills_path and not (plugin.path / skills_path).is_dir():
+            errors.append(f"plugin.json 'skills' path does not exist: {rel}/{skills_path}")
+
+    return {"errors": errors, "warnings": warnings}
+
+
+def load_cache(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_cache(path: Path, cache: dict) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".skill-validate-")
+    with os.fdopen(fd, "w") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def run_validation(
+    repo_root: Path,
+    skill_dirs: list[Path] | None = None,
+    workers: int | None = None,
+    use_cache: bool = True,
+) -> dict:
+    """Validate skills in parallel, reusing cached results for unchanged skills.
+
+    With no skill_dirs, every plugins/*/skills/*/ directory is validated (the
+    same set validate-skill.sh checks) and marketplace.json is cross-checked
+    against each plugin.json.
+
+    Returns:
+        {"skills": [...], "marketplace": {...} | None, "errors": int, "warnings": int, "cached": int}
+    """
+    repo_root = repo_root.resolve()
+    marketplace_result = None
+    if skill_dirs is None:
+        marketplace, plugins = discover(repo_root)
+        skill_dirs = [Path(os.path.relpath(d)) for d in sorted(repo_root.glob("plugins/*/skills/*/")) if d.is_dir()]
+        marketplace_result = validate_marketplace(marketplace, plugins, repo_root)
+
+    cache_path = repo_root / CACHE_NAME
+    cache = load_cache(cache_path) if use_cache else {}
+
+    def check(skill_dir: Path) -> dict:
+        key = os.path.relpath(skill_dir.resolve(), repo_root)
+        digest = skill_hash(skill_dir)
+        cached = cache.get(key)
+        if cached and cached.get("hash") == digest:
+            return {**cached["result"], "path": str(skill_dir), "cached": True}
+        result = validate_skill(skill_dir)
+        cache[key] = {"hash": digest, "result": result}
+        return {**result, "cached": False}
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(check, [Path(d) for d in skill_dirs]))
+
+    if marketplace_result is not None:
+        seen: dict[str, str] = {}
+        for result in results:
+            name = result.get("name") or result["skill"]
+            if name in seen:
+                marketplace_result["warnings"].append(
+                    f"Duplicate skill name '{name}' in {seen[name]} and {result['path']}")
+            seen.setdefault(name, result["path"])
+
+    if use_cache:
+        if marketplace_result is not None:
+            current = {os.path.relpath(Path(d).resolve(), repo_root) for d in skill_dirs}
+            cache = {k: v for k, v in cache.items() if k in current}
+        save_cache(cache_path, cache)
+
+    issues = results + ([marketplace_result] if marketplace_result else [])
+    return {
+        "skills": results,
+        "marketplace": marketplace_result,
+        "errors": sum(len(r["errors"]) for r in issues),
+        "warnings": sum(len(r["warnings"]) for r in issues),
+        "cached": sum(1 for r in results if r["cached"]),
+    }
+
+
+def print_report(report: dict) -> None:
+    """Print results in the same layout as validate-skill.sh."""
+    print("==========================================")
+    print("  Skill Validator")
+    print("==========================================")
+    print()
+    for result in report["skills"]:
+        print(f"Validating: {result['skill']}{' (cached)' if result['cached'] else ''}")
+        print(f"  Path: {result['path']}/")
+        for message in result["errors"]:
+            print(f"ERROR: {message}")
+        for message in result["warnings"]:
+            print(f"WARNING: {message}")
+        print("  Done.")
+        print()
+    if report["marketplace"] is not None:
+        print("Validating: marketplace.json")
+        for message in report["marketplace"]["errors"]:
+            print(f"ERROR: {message}")
+        for message in report["marketplace"]["warnings"]:
+            print(f"WARNING: {message}")
+        print("  Done.")
+        print()
+
+    print("==========================================")
+    print("  Results")
+    print("==========================================")
+    print(f"  Skills validated: {len(report['skills'])} ({report['cached']} unchanged)")
+    print(f"  Errors:           {report['errors']}")
+    print(f"  Warnings:         {report['warnings']}")
+    print("==========================================")
+    if report["errors"]:
+        print()
+        print(f"Validation FAILED with {report['errors']} error(s).")
+    else:
+        print()
+        print("All validations passed!")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Validate skill structure, frontmatter and marketplace manifests")
+    parser.add_argument("skills", nargs="*", help="Skill directories to validate")
+    parser.add_argument("--all", action="store_true", help="Validate every skill and cross-check manifests")
+    parser.add_argument("--repo-root", type=Path, default=Path.cwd(), help="Marketplace root (default: cwd)")
+    parser.add_argument("--json", action="store_true", help="Print a machine-readable JSON report")
+    parser.add_argument("--no-cache", action="store_true", help="Re-validate every skill")
+    parser.add_argument("-j", "--parallel", type=int, default=None, help="Worker threads")
+    args = parser.parse_args()
+
+    if not args.all and not args.skills:
+        parser.print_usage()
+        sys.exit(1)
+
+    report = run_validation(
+        args.repo_root,
+        None if args.all else [Path(s.rstrip("/")) for s in args.skills],
+        workers=args.parallel,
+        use_cache=not args.no_cache,
+    )
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    sys.exit(1 if report["errors"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,16 +3,20 @@
 List Databricks workspace contents with optional recursion.
 
 Usage:
-    python list_workspace.py /path [--recursive] [--max-depth N]
+    python list_workspace.py /path [--recursive] [--max-depth N] [--workers N]
+                             [--include GLOB] [--exclude GLOB] [--max-objects N] [--stream]
 """
 
 import argparse
 import json
 import subprocess
 import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from fnmatch import fnmatch
 
 
-def run_databricks_command(args: list[str]) -> dict | list | None:
+def run_databricks_command(args: list[str], raise_errors: bool = False) -> dict | list | None:
     """Run a databricks CLI command and return parsed JSON output."""
     try:
         result = subprocess.run(
@@ -21,12 +25,14 @@ def run_databricks_command(args: list[str]) -> dict | list | None:
         )
         return json.loads(result.stdout) if result.stdout.strip() else None
     except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
+        if raise_errors:
+            raise
         print(f"Error: {e}", file=sys.stderr)
         return None
 
 
-def list_workspace(path: str) -> list[dict]:
-    result = run_databricks_command(["workspace", "list", path])
+def list_workspace(path: str, raise_errors: bool = False) -> list[dict]:
+    result = run_databricks_command(["workspace", "list", path], raise_errors)
     if isinstance(result, dict) and "objects" in result:
         return result["objects"]
     return result if isinstance(result, list) else []
@@ -42,11 +48,100 @@ def format_object(obj: dict, indent: int = 0) -> str:
     return f"{prefix}{indicator} {name}{f' ({lang.lower()})' if lang else ''}"
 
 
-def list_recursive(path: str, max_depth: int, depth: int = 0) -> None:
-    for obj in list_workspace(path):
-        print(format_object(obj, depth))
-        if obj.get("object_type") == "DIRECTORY" and depth < max_depth:
-            list_recursive(obj["path"], max_depth, depth + 1)
+def matches(path: str, patterns: list[str]) -> bool:
+    return any(fnmatch(path, p) or fnmatch(path.split("/")[-1], p) for p in patterns)
+
+
+def crawl_workspace(
+    root: str,
+    max_depth: int,
+    workers: int = 8,
+    exclude: list[str] | None = None,
+    max_objects: int | None = None,
+    on_entry=None,
+) -> dict:
+    """Breadth-first crawl listing each frontier directory concurrently.
+
+    Excluded paths are never listed; include globs only filter what
+    `render_tree` prints, since matching files can sit in any directory.
+
+    Returns the children of every listed directory keyed by path, the
+    directories whose listing failed (absent from children), the directories
+    with excluded children, the number of API calls, elapsed seconds and
+    whether the object cap was hit.
+    """
+    exclude = exclude or []
+    start = time.perf_counter()
+    children: dict[str, list[dict]] = {}
+    failed: list[str] = []
+    filtered: list[str] = []
+    total = calls = 0
+    truncated = False
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(list_workspace, root, True): (root, 0)}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path, depth = pending.pop(future)
+                calls += 1
+                try:
+                    objects = future.result()
+                except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
+                    print(f"Error listing {path}: {getattr(e, 'stderr', None) or e}".rstrip(), file=sys.stderr)
+                    failed.append(path)
+                    continue
+                kept = []
+                for obj in objects:
+                    if matches(obj.get("path", ""), exclude):
+                        if path not in filtered:
+                            filtered.append(path)
+                        continue
+                    if max_objects is not None and total >= max_objects:
+                        truncated = True
+                        break
+                    total += 1
+                    kept.append(obj)
+                    if on_entry:
+                        on_entry(obj, depth)
+                    if obj.get("object_type") == "DIRECTORY" and depth < max_depth and not truncated:
+                        pending[pool.submit(list_workspace, obj["path"], True)] = (obj["path"], depth + 1)
+                children[path] = kept
+            if truncated:
+                for future in pending:
+                    future.cancel()
+                pending.clear()
+
+    return {
+        "children": children,
+        "failed": sorted(failed),
+        "filtered": sorted(filtered),
+        "objects": total,
+        "api_calls": calls,
+        "elapsed": time.perf_counter() - start,
+        "truncated": truncated,
+    }
+
+
+def render_tree(children: dict[str, list[dict]], path: str, include: list[str] | None = None, depth: int = 0) -> list[str]:
+    """Render crawl results in the same depth-first order as a sequential walk."""
+    lines = []
+    for obj in children.get(path, []):
+        if obj.get("object_type") == "DIRECTORY":
+            sub = render_tree(children, obj["path"], include, depth + 1)
+            if not include or sub or matches(obj["path"], include):
+                lines.append(format_object(obj, depth))
+                lines.extend(sub)
+        elif not include or matches(obj.get("path", ""), include):
+            lines.append(format_object(obj, depth))
+    return lines
+
+
+def list_recursive(path: str, max_depth: int, include: list[str] | None = None, **kwargs) -> dict:
+    result = crawl_workspace(path, max_depth, **kwargs)
+    for line in render_tree(result["children"], path, include):
+        print(line)
+    return result
 
 
 def main():
@@ -54,12 +149,30 @@ def main():
     parser.add_argument("path", help="Workspace path to list")
     parser.add_argument("--recursive", "-r", action="store_true")
     parser.add_argument("--max-depth", "-d", type=int, default=3)
+    parser.add_argument("--workers", "-w", type=int, default=8, help="Concurrent list calls")
+    parser.add_argument("--include", action="append", default=[], help="Glob of paths/names to print; does not reduce API calls (repeatable)")
+    parser.add_argument("--exclude", action="append", default=[], help="Glob of paths/names to skip (repeatable)")
+    parser.add_argument("--max-objects", type=int, help="Stop after this many objects")
+    parser.add_argument("--stream", action="store_true", help="Print paths to stderr as they are listed")
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
 
     if args.recursive:
         print(f"Listing {args.path} (recursive, max depth: {args.max_depth})")
         print("-" * 50)
-        list_recursive(args.path, args.max_depth)
+        on_entry = (lambda obj, depth: print(obj.get("path", ""), file=sys.stderr, flush=True)) if args.stream else None
+        result = list_recursive(
+            args.path, args.max_depth,
+            workers=args.workers, include=args.include, exclude=args.exclude,
+            max_objects=args.max_objects, on_entry=on_entry,
+        )
+        print("-" * 50)
+        print(f"{result['objects']} object(s), {result['api_calls']} API call(s), {result['elapsed']:.2f}s"
+              + (f" (truncated at --max-objects {args.max_objects})" if result["truncated"] else ""))
+        if result["failed"]:
+            print(f"{len(result['failed'])} director(ies) could not be listed", file=sys.stderr)
+            sys.exit(1)
     else:
         objects = list_workspace(args.path)
         if not objects:
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Full-text search over a local workspace mirror using an SQLite FTS5 index.
+
+Usage:
+    python search_workspace.py index <mirror-dir>
+    python search_workspace.py query <mirror-dir> <text> [--notebook-id ID] [--path GLOB] [--limit N]
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+from sync_workspace import MANIFEST_NAME, NOTEBOOK_EXTENSIONS, local_path
+
+INDEX_NAME = ".workspace-index.sqlite"
+LANGUAGES = {ext: lang for lang, ext in NOTEBOOK_EXTENSIONS.items()} | {".ipynb": "PYTHON"}
+CELL_SEPARATOR = re.compile(r"^\s*(#|--|//)\s*COMMAND -{5,}\s*$")
+# Control characters used to mark matched tokens in highlight() output
+MATCH_START, MATCH_END = "\x02", "\x03"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    local_path TEXT PRIMARY KEY,
+    workspace_path TEXT,
+    object_id TEXT,
+    language TEXT,
+    mtime_ns INTEGER,
+    size INTEGER
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS cells USING fts5(
+    content,
+    local_path UNINDEXED,
+    cell UNINDEXED,
+    start_line UNINDEXED
+);
+"""
+
+
+def connect(mirror: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(mirror / INDEX_NAME)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def split_cells(text: str) -> list[tuple[int, str]]:
+    """Split notebook source into (start_line, content) cells on `COMMAND ----------` markers."""
+    cells, start, current = [], 1, []
+    for lineno, line in enumerate(text.splitlines(), 1):
+        if CELL_SEPARATOR.match(line):
+            cells.append((start, "\n".join(current)))
+            start, current = lineno + 1, []
+        else:
+            current.append(line)
+    cells.append((start, "\n".join(current)))
+    return [(s, c) for s, c in cells if c.strip()]
+
+
+def read_source(path: Path) -> str:
+    text = path.read_text(errors="replace")
+    if path.suffix != ".ipynb":
+        return text
+    try:
+        nb = json.loads(text)
+    except json.JSONDecodeError:
+        return text
+    sources = ["".join(c.get("source", [])) for c in nb.get("cells", [])]
+    return "\n# COMMAND ----------\n".join(sources)
+
+
+def workspace_objects(mirror: Path) -> dict[str, tuple[str, str, str | None, str | None]]:
+    """Map mirror-relative paths to (workspace_path, object_id, language, object_type) from the sync manifest."""
+    try:
+        data = json.loads((mirror / MANIFEST_NAME).read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    root = data.get("root", "")
+    return {
+        local_path(mirror, root, {"path": path, **meta}).relative_to(mirror).as_posix():
+            (path, str(meta.get("object_id", "")), meta.get("language"), meta.get("object_type"))
+        for path, meta in data.get("objects", {}).items()
+    }
+
+
+def build_index(mirror: Path) -> dict:
+    """Index new or modified notebook sources under `mirror` and drop entries for deleted ones.
+
+    Only notebooks (per the sync manifest) and files with a source suffix are
+    indexed; other workspace files such as wheels or parquet are skipped.
+    """
+    conn = connect(mirror)
+    known = {row[0]: (row[1], row[2]) for row in conn.execute("SELECT local_path, mtime_ns, size FROM files")}
+    objects = workspace_objects(mirror)
+    seen, updated = set(), 0
+
+    with conn:
+        for dirpath, dirnames, filenames in os.walk(mirror):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            for name in filenames:
+                if name.startswith("."):
+                    continue
+                path = Path(dirpath) / name
+                rel = path.relative_to(mirror).as_posix()
+                workspace_path, object_id, language, object_type = objects.get(rel, ("", "", None, None))
+                if object_type != "NOTEBOOK" and path.suffix.lower() not in LANGUAGES:
+                    continue
+                st = path.stat()
+                seen.add(rel)
+                if known.get(rel) == (st.st_mtime_ns, st.st_size):
+                    continue
+                language = language or LANGUAGES.get(path.suffix.lower())
+                conn.execute("DELETE FROM cells WHERE local_path = ?", (rel,))
+                conn.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)",
+                             (rel, workspace_path, object_id, language, st.st_mtime_ns, st.st_size))
+                conn.executemany("INSERT INTO cells (content, local_path, cell, start_line) VALUES (?, ?, ?, ?)",
+                                 [(content, rel, i, start) for i, (start, content) in enumerate(split_cells(read_source(path)))])
+                updated += 1
+        removed = [rel for rel in known if rel not in seen]
+        for rel in removed:
+            conn.execute("DELETE FROM cells WHERE local_path = ?", (rel,))
+            conn.execute("DELETE FROM files WHERE local_path = ?", (rel,))
+    conn.close()
+    return {"files": len(seen), "updated": updated, "removed": len(removed)}
+
+
+def to_fts_query(text: str) -> str:
+    """Quote each term as a phrase so names like `main.sales.orders` need no FTS syntax."""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in text.split())
+
+
+def search(mirror: Path, text: str, raw: bool = False, notebook_id: str | None = None,
+           path_glob: str | None = None, limit: int = 20) -> list[dict]:
+    """Return the best-ranked matching cells, filtered and limited in SQL.
+
+    Matching lines are found with FTS5 `highlight()`, so they reflect the
+    tokens the query actually matched, for raw queries too.
+    """
+    sql = f"""
+        SELECT c.local_path, c.cell, c.start_line, highlight(cells, 0, '{MATCH_START}', '{MATCH_END}'),
+               f.workspace_path, f.object_id, f.language
+        FROM cells c JOIN files f ON f.local_path = c.local_path
+        WHERE cells MATCH ?
+    """
+    params: list = [text if raw else to_fts_query(text)]
+    if notebook_id:
+        sql += " AND f.object_id = ?"
+        params.append(notebook_id)
+    if path_glob:
+        sql += " AND COALESCE(NULLIF(f.workspace_path, ''), c.local_path) GLOB ?"
+        params.append(path_glob)
+    sql += " ORDER BY rank LIMIT ?"
+    params.append(limit)
+
+    conn = connect(mirror)
+    rows = conn.execute(sql, params).fetchall()
+    conn.close()
+
+    results = []
+    for rel, cell, start, content, workspace_path, object_id, language in rows:
+        lines = [
+            {"line": start + i, "text": line.replace(MATCH_START, "").replace(MATCH_END, "").strip()}
+            for i, line in enumerate(content.splitlines())
+            if MATCH_START in line
+        ]
+        results.append({
+            "workspace_path": workspace_path, "object_id": object_id, "local_path": rel,
+            "language": language, "cell": cell, "start_line": start, "lines": lines,
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search a local workspace mirror")
+    sub = parser.add_subparsers(dest="command", required=True)
+    index_cmd = sub.add_parser("index", help="Build or update the index")
+    index_cmd.add_argument("mirror", type=Path, help="Mirror or export directory")
+    query_cmd = sub.add_parser("query", help="Search indexed notebooks")
+    query_cmd.add_argument("mirror", type=Path, help="Mirror or export directory")
+    query_cmd.add_argument("text", help="Text to search for, e.g. a table name")
+    query_cmd.add_argument("--raw", action="store_true", help="Pass text through as an FTS5 query")
+    query_cmd.add_argument("--notebook-id", help="Only match this notebook (lineage notebook_id)")
+    query_cmd.add_argument("--path", help="Only match workspace paths matching this glob (case-sensitive)")
+    query_cmd.add_argument("--limit", "-n", type=int, default=20)
+    query_cmd.add_argument("--no-update", action="store_true", help="Skip refreshing the index first")
+    query_cmd.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    if not args.mirror.is_dir():
+        print(f"Error: {args.mirror} is not a directory", file=sys.stderr)
+        sys.exit(1)
+
+    if args.command == "index":
+        start = time.perf_counter()
+        stats = build_index(args.mirror)
+        print(f"Indexed {stats['files']} file(s): {stats['updated']} updated, {stats['removed']} removed "
+              f"in {time.perf_counter() - start:.2f}s")
+        return
+
+    start = time.perf_counter()
+    if not args.no_update:
+        build_index(args.mirror)
+    refreshed = time.perf_counter()
+    try:
+        results = search(args.mirror, args.text, args.raw, args.notebook_id, args.path, args.limit)
+    except sqlite3.OperationalError as e:
+        print(f"Error: invalid query: {e}", file=sys.stderr)
+        sys.exit(1)
+    elapsed = (time.perf_counter() - refreshed) * 1000
+    refresh = (refreshed - start) * 1000
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{len(results)} matching cell(s) for '{args.text}' ({elapsed:.1f} ms"
+          + (f", index refresh {refresh:.1f} ms)" if not args.no_update else ")"))
+    print("-" * 50)
+    for r in results:
+        ident = f" (id: {r['object_id']})" if r["object_id"] else ""
+        print(f"[NB] {r['workspace_path'] or r['local_path']}{ident} cell {r['cell']} @ line {r['start_line']}")
+        for line in r["lines"]:
+            print(f"  {line['line']:>5}: {line['text']}")
+
+
+if __name__ == "__main__":
+    main()
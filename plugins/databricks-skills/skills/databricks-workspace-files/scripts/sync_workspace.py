@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Mirror a Databricks workspace subtree into a local cache, exporting only changes.
+
+Usage:
+    python sync_workspace.py /path [--dest DIR] [--workers N] [--bulk-threshold N]
+                             [--exclude GLOB] [--dry-run]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from list_workspace import crawl_workspace
+
+MANIFEST_NAME = ".workspace-manifest.json"
+DEFAULT_DEST = Path.home() / ".cache" / "databricks-workspace-mirror"
+NOTEBOOK_EXTENSIONS = {"PYTHON": ".py", "SQL": ".sql", "SCALA": ".scala", "R": ".r"}
+
+
+def run_cli(args: list[str]) -> bool:
+    """Run a databricks CLI command, returning True on success."""
+    try:
+        subprocess.run(["databricks"] + args, capture_output=True, text=True, check=True)
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"Error: {' '.join(args[:3])}: {e.stderr.strip() or e}", file=sys.stderr)
+        return False
+
+
+def local_path(dest: Path, root: str, obj: dict) -> Path:
+    """Map a workspace object to its mirror path, matching `export-dir` naming."""
+    rel = obj["path"][len(root):].lstrip("/")
+    if obj.get("object_type") == "NOTEBOOK":
+        rel += NOTEBOOK_EXTENSIONS.get(obj.get("language", ""), "")
+    return dest / rel
+
+
+def load_manifest(dest: Path, root: str) -> dict[str, dict]:
+    try:
+        data = json.loads((dest / MANIFEST_NAME).read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data.get("objects", {}) if data.get("root") == root else {}
+
+
+def save_manifest(dest: Path, root: str, objects: dict[str, dict]) -> None:
+    fd, tmp = tempfile.mkstemp(dir=dest, prefix=".manifest-")
+    with os.fdopen(fd, "w") as f:
+        json.dump({"root": root, "synced_at": int(time.time()), "objects": objects}, f, indent=2, sort_keys=True)
+    os.replace(tmp, dest / MANIFEST_NAME)
+
+
+def entry(obj: dict) -> dict:
+    return {k: obj.get(k) for k in ("object_id", "modified_at", "object_type", "language")}
+
+
+def under(path: str, dirs) -> bool:
+    return any(path == d or path.startswith(d.rstrip("/") + "/") for d in dirs)
+
+
+def plan_bulk(
+    children: dict[str, list[dict]],
+    root: str,
+    changed: set[str],
+    threshold: int,
+    incomplete: set[str] = frozenset(),
+) -> list[str]:
+    """Pick the outermost directories whose files are all changed and number at least `threshold`.
+
+    Directories that are, or contain, an `incomplete` directory (listing failed
+    or children excluded) are never picked, since export-dir would fetch
+    everything under them.
+    """
+    counts: dict[str, tuple[int, int]] = {}
+
+    def walk(path: str) -> tuple[int, int]:
+        total = int(path in incomplete)  # Unknown or excluded contents: never fully changed
+        dirty = 0
+        for obj in children.get(path, []):
+            if obj.get("object_type") == "DIRECTORY":
+                t, d = walk(obj["path"])
+            else:
+                t, d = 1, int(obj["path"] in changed)
+            total, dirty = total + t, dirty + d
+        counts[path] = (total, dirty)
+        return total, dirty
+
+    def pick(path: str) -> list[str]:
+        total, dirty = counts[path]
+        if total >= threshold and dirty == total:
+            return [path]
+        return [p for obj in children.get(path, []) if obj.get("object_type") == "DIRECTORY" for p in pick(obj["path"])]
+
+    walk(root)
+    return pick(root)
+
+
+def export_file(obj: dict, target: Path) -> bool:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    args = ["workspace", "export", obj["path"], "--file", str(target), "--overwrite"]
+    if obj.get("object_type") == "NOTEBOOK":
+        args += ["--format", "SOURCE"]
+    return run_cli(args)
+
+
+def export_dir(path: str, target: Path) -> bool:
+    target.mkdir(parents=True, exist_ok=True)
+    return run_cli(["workspace", "export-dir", path, str(target), "--overwrite"])
+
+
+def prune(dest: Path, root: str, removed: dict[str, dict]) -> None:
+    for path, meta in removed.items():
+        target = local_path(dest, root, {"path": path, **meta})
+        if target.is_file():
+            target.unlink()
+    for dirpath, _, _ in sorted(os.walk(dest), key=lambda w: -len(w[0])):
+        if Path(dirpath) != dest and not os.listdir(dirpath):
+            os.rmdir(dirpath)
+
+
+def sync_workspace(
+    root: str,
+    dest: Path,
+    workers: int = 8,
+    bulk_threshold: int = 50,
+    exclude: list[str] | None = None,
+    dry_run: bool = False,
+) -> dict:
+    """Bring `dest` up to date with `root`, returning counts of what changed.
+
+    Subtrees whose listing failed keep their manifest entries and local files.
+    Objects whose mirror path changed (e.g. a notebook's language) lose the
+    old copy.
+    """
+    root = root.rstrip("/") or "/"
+    dest.mkdir(parents=True, exist_ok=True)
+    previous = load_manifest(dest, root)
+    crawl = crawl_workspace(root, max_depth=sys.maxsize, workers=workers, exclude=exclude)
+    children = crawl["children"]
+    failed = set(crawl["failed"])
+
+    current = {
+        obj["path"]: obj
+        for objs in children.values() for obj in objs
+        if obj.get("object_type") != "DIRECTORY"
+    }
+    changed = {p for p, obj in current.items() if previous.get(p) != entry(obj)}
+    removed = {p: meta for p, meta in previous.items() if p not in current and not under(p, failed)}
+    moved = {p: previous[p] for p in changed if p in previous
+             and local_path(dest, root, {"path": p, **previous[p]}) != local_path(dest, root, current[p])}
+    stats = {"listed": len(current), "changed": len(changed), "removed": len(removed),
+             "bulk_dirs": 0, "failed": 0, "unlisted_dirs": len(failed), "api_calls": crawl["api_calls"]}
+    if dry_run:
+        return stats
+
+    manifest = {p: meta for p, meta in previous.items()
+                if (p in current and p not in changed) or (p not in current and under(p, failed))}
+    bulk = plan_bulk(children, root, changed, bulk_threshold, failed | set(crawl["filtered"])) if changed else []
+    stats["bulk_dirs"] = len(bulk)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        jobs = {pool.submit(export_dir, d, dest / d[len(root):].lstrip("/")): [p for p in changed if under(p, [d])]
+                for d in bulk}
+        jobs.update({pool.submit(export_file, current[p], local_path(dest, root, current[p])): [p]
+                     for p in changed if not under(p, bulk)})
+        for future, paths in jobs.items():
+            if future.result():
+                manifest.update({p: entry(current[p]) for p in paths})
+            else:
+                stats["failed"] += len(paths)
+
+    prune(dest, root, {**removed, **moved})
+    save_manifest(dest, root, manifest)
+    stats["api_calls"] += len(jobs)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incrementally mirror a Databricks workspace subtree")
+    parser.add_argument("path", help="Workspace path to mirror")
+    parser.add_argument("--dest", type=Path, help=f"Local mirror directory (default: {DEFAULT_DEST}/<path>)")
+    parser.add_argument("--workers", "-w", type=int, default=8, help="Concurrent CLI calls")
+    parser.add_argument("--bulk-threshold", type=int, default=50,
+                        help="Use export-dir for fully changed subtrees with at least this many files")
+    parser.add_argument("--exclude", action="append", default=[], help="Glob of paths/names to skip (repeatable)")
+    parser.add_argument("--dry-run", action="store_true", help="Report changes without exporting")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    dest = args.dest or DEFAULT_DEST / args.path.strip("/")
+    start = time.perf_counter()
+    stats = sync_workspace(args.path, dest, args.workers, args.bulk_threshold, args.exclude, args.dry_run)
+    stats["elapsed"] = round(time.perf_counter() - start, 2)
+
+    if args.json:
+        print(json.dumps({"dest": str(dest), **stats}, indent=2))
+    else:
+        print(f"Synced {args.path} -> {dest}{' (dry run)' if args.dry_run else ''}")
+        print("-" * 50)
+        print(f"{stats['listed']} file(s) listed, {stats['changed']} changed, {stats['removed']} removed, "
+              f"{stats['bulk_dirs']} bulk export(s), {stats['api_calls']} API call(s), {stats['elapsed']}s")
+    if stats["failed"]:
+        print(f"{stats['failed']} object(s) failed to export; they will be retried next run", file=sys.stderr)
+    if stats["unlisted_dirs"]:
+        print(f"{stats['unlisted_dirs']} director(ies) could not be listed; their mirrored files were kept",
+              file=sys.stderr)
+    if stats["failed"] or stats["unlisted_dirs"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,44 +3,67 @@
 Convert Graphviz DOT files to Lucid Chart compatible XML format and PNG image.
 
 Usage:
-    python convert_to_lucid.py <input.dot> [output.xml]
+    python convert_to_lucid.py <input.dot> [output.xml | -o output]
+    python convert_to_lucid.py <input.dot|directory> ... [--jobs N] [--force]
 
 If output is not specified, creates <input>.xml and <input>.png in the same directory.
+A second argument that is not a .dot/.gv file or a directory is taken as the output.
+
+Batch mode accepts several files and/or directories (searched for .dot/.gv files),
+converts them in parallel, and skips inputs whose content hash matches the last
+successful conversion (recorded in a .lucid-cache.json file next to the inputs).
+
+By default Graphviz lays the graph out once (`dot -Tjson0 -Tpng` in a single run)
+and the XML is built from those positioned nodes and edges, so the PNG and XML
+always match. Pass --legacy to convert with graphviz2drawio instead.
+
+Large-graph mode (--large or --collapse-threshold N) streams the XML to disk and
+collapses clusters with more than N nodes into summary nodes that link to
+drill-down pages, then reports node/cell counts, XML size and, for a single
+input, peak memory.
 
 Requirements:
-    pip install graphviz2drawio
     Graphviz must be installed (brew install graphviz on macOS)
+    pip install graphviz2drawio (only for --legacy, or when Graphviz is missing)
 """
 
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
 import sys
 import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from xml.sax.saxutils import quoteattr
+
+DOT_SUFFIXES = [".dot", ".gv"]
+CACHE_NAME = ".lucid-cache.json"
+POINTS_PER_INCH = 72
+
+# Graphviz shape -> mxGraph style fragment
+SHAPE_STYLES = {
+    "box": "rounded=0", "rect": "rounded=0", "rectangle": "rounded=0", "square": "rounded=0",
+    "ellipse": "ellipse", "oval": "ellipse", "circle": "ellipse;aspect=fixed",
+    "doublecircle": "ellipse;shape=doubleEllipse;aspect=fixed", "point": "ellipse;aspect=fixed",
+    "cylinder": "shape=cylinder3;boundedLbl=1;size=10", "folder": "shape=folder;tabWidth=40;tabHeight=14",
+    "diamond": "rhombus", "note": "shape=note;size=14", "hexagon": "shape=hexagon",
+    "parallelogram": "shape=parallelogram", "triangle": "triangle;direction=north",
+    "plaintext": "text", "plain": "text", "none": "text",
+}
 
 
 def check_dependencies():
     """Check if graphviz2drawio is installed."""
-    try:
-        result = subprocess.run(
-            ["graphviz2drawio", "--version"],
-            capture_output=True,
-            text=True
-        )
-        return True
-    except FileNotFoundError:
-        return False
+    return shutil.which("graphviz2drawio") is not None
 
 
 def check_graphviz():
     """Check if Graphviz dot command is available."""
-    try:
-        result = subprocess.run(
-            ["dot", "-V"],
-            capture_output=True,
-            text=True
-        )
-        return True
-    except FileNotFoundError:
-        return False
+    return shutil.which("dot") is not None
 
 
 def convert_dot_to_png(input_path: str, output_path: str = None) -> str:
@@ -96,7 +119,7 @@ def convert_dot_to_xml(input_path: str, output_path: str = None) -> str:
     if not input_file.exists():
         raise FileNotFoundError(f"Input file not found: {input_path}")
 
-    if not input_file.suffix.lower() in [".dot", ".gv"]:
+    if not input_file.suffix.lower() in DOT_SUFFIXES:
         raise ValueError(f"Expected .dot or .gv file, got: {input_file.suffix}")
 
     # Determine output path
@@ -124,35 +147,517 @@ def convert_dot_to_xml(input_path: str, output_path: str = None) -> str:
         raise RuntimeError(f"Conversion failed: {e.stderr}")
 
 
+def layout_dot(input_path: str, png_path: str = None) -> dict:
+    """
+    Lay out a DOT file once, optionally rendering the PNG in the same Graphviz run.
+
+    Args:
+        input_path: Path to the .dot file
+        png_path: Optional path for a PNG rendered from the same layout
+
+    Returns:
+        The Graphviz JSON layout
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        json_file = Path(tmp) / "layout.json"
+        # json0 has the positions and attributes without xdot drawing ops, keeping large layouts small
+        cmd = ["dot", "-Tjson0", "-o", str(json_file)]
+        if png_path:
+            Path(png_path).parent.mkdir(parents=True, exist_ok=True)
+            cmd += ["-Tpng", "-o", str(png_path)]
+        try:
+            subprocess.run(cmd + [str(input_path)], capture_output=True, text=True, check=True)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Graphviz layout failed: {e.stderr}")
+        return json.loads(json_file.read_text())
+
+
+def parse_label(obj: dict, default: str) -> str:
+    """Resolve a Graphviz label to plain text, expanding escapes and dropping HTML tags."""
+    label = obj.get("label", "\\N")
+    if label.startswith("<") and label.endswith(">"):
+        label = re.sub(r"<[^>]+>", "", re.sub(r"<br\s*/?>", "\n", label[1:-1], flags=re.I))
+    label = label.replace("\\N", default).replace("\\G", "")
+    for escape in ("\\n", "\\l", "\\r"):
+        label = label.replace(escape, "\n")
+    return label.strip()
+
+
+def node_style(obj: dict) -> str:
+    """Translate Graphviz node attributes into an mxGraph style string."""
+    styles = obj.get("style", "")
+    shape = SHAPE_STYLES.get(obj.get("shape", "ellipse"), "rounded=0")
+    if "rounded" in styles:
+        shape = shape.replace("rounded=0", "rounded=1")
+    parts = [shape, "whiteSpace=wrap"]
+    if "dashed" in styles:
+        parts.append("dashed=1")
+    if "filled" in styles:
+        parts.append(f"fillColor={obj.get('fillcolor') or obj.get('color') or 'lightgrey'}")
+    else:
+        parts.append("fillColor=none")
+    parts.append(f"strokeColor={obj.get('color', '#000000')}")
+    parts.append(f"fontColor={obj.get('fontcolor', '#000000')}")
+    if "fontsize" in obj:
+        parts.append(f"fontSize={obj['fontsize']}")
+    return ";".join(parts) + ";"
+
+
+def edge_style(obj: dict) -> str:
+    parts = ["rounded=0", "curved=1", f"strokeColor={obj.get('color', '#333333').split(':')[0]}"]
+    if "dashed" in obj.get("style", ""):
+        parts.append("dashed=1")
+    if "dotted" in obj.get("style", ""):
+        parts.append("dashed=1;dashPattern=1 4")
+    if obj.get("dir") in ("none", "back", "both"):
+        parts.append("endArrow=none" if obj["dir"] in ("none", "back") else "startArrow=classic")
+    if "penwidth" in obj:
+        parts.append(f"strokeWidth={obj['penwidth']}")
+    return ";".join(parts) + ";"
+
+
+def cluster_cell(obj: dict, flip, cell_id: str, value: str = None, link: str = None) -> tuple:
+    """Build a vertex covering a cluster's bounding box."""
+    x0, y0, x1, y1 = map(float, obj["bb"].split(","))
+    x, y = flip(x0, y1)
+    attrs = {"id": cell_id, "value": parse_label(obj, "") if value is None else value,
+             "style": node_style({**obj, "shape": "box"}) + "verticalAlign=top;", "vertex": "1", "parent": "1"}
+    if link:
+        attrs["link"] = link
+    return attrs, {"x": x, "y": y, "width": round(x1 - x0, 2), "height": round(y1 - y0, 2)}, None
+
+
+def node_cell(obj: dict, flip) -> tuple:
+    cx, cy = map(float, obj["pos"].split(","))
+    w = float(obj.get("width", 0.75)) * POINTS_PER_INCH
+    h = float(obj.get("height", 0.5)) * POINTS_PER_INCH
+    x, y = flip(cx - w / 2, cy + h / 2)
+    return ({"id": f"n{obj['_gvid']}", "value": parse_label(obj, obj.get("name", "")), "style": node_style(obj),
+             "vertex": "1", "parent": "1"},
+            {"x": x, "y": y, "width": round(w, 2), "height": round(h, 2)}, None)
+
+
+def edge_cell(edge: dict, flip, source: str, target: str, routed: bool = True, value: str = None) -> tuple:
+    waypoints = None
+    if routed:
+        spline = [p for p in edge.get("pos", "").split() if not p.startswith(("e,", "s,"))]
+        coords = [tuple(map(float, p.split(","))) for p in spline]
+        # Keep the on-curve points of the cubic Bezier as waypoints
+        waypoints = [flip(*c) for c in coords[3:-1:3]]
+    if value is None:
+        value = parse_label(edge, "") if "label" in edge else ""
+    return ({"id": f"e{edge['_gvid']}", "value": value, "style": edge_style(edge), "edge": "1", "parent": "1",
+             "source": source, "target": target},
+            {"relative": "1"}, waypoints)
+
+
+def make_flip(height: float, ox: float = 0, oy: float = 0):
+    """
+    Map Graphviz points to mxGraph coordinates.
+
+    Graphviz uses points with the origin bottom-left; mxGraph uses a top-left
+    origin, so y coordinates are flipped against the graph bounding box and then
+    shifted by (ox, oy) to place a drill-down page at its own origin.
+    """
+    def flip(x: float, y: float) -> tuple[float, float]:
+        return round(x - ox, 2), round(height - y - oy, 2)
+    return flip
+
+
+def layout_cells(layout: dict):
+    """
+    Yield mxGraph cells for a Graphviz JSON layout.
+
+    Yields:
+        (attributes, geometry, points) tuples for each cell, clusters first
+    """
+    flip = make_flip(float(layout.get("bb", "0,0,0,0").split(",")[3]))
+    objects = layout.get("objects", [])
+    for obj in objects:
+        if is_cluster(obj):
+            yield cluster_cell(obj, flip, f"c{obj['_gvid']}")
+    for obj in objects:
+        if "pos" in obj:
+            yield node_cell(obj, flip)
+    for edge in layout.get("edges", []):
+        yield edge_cell(edge, flip, f"n{edge['tail']}", f"n{edge['head']}")
+
+
+def is_cluster(obj: dict) -> bool:
+    return "nodes" in obj and "bb" in obj and obj.get("name", "").startswith("cluster")
+
+
+def collapsed_pages(layout: dict, name: str, threshold: int) -> tuple[list, int]:
+    """
+    Split a layout into an overview page plus one drill-down page per large cluster.
+
+    Outermost clusters with more than `threshold` nodes are drawn on the overview
+    as a single summary node linking to a page holding their contents; edges that
+    cross into a collapsed cluster are redirected to its summary node and merged.
+
+    Returns:
+        ([(page_id, page_name, cells), ...], number of collapsed clusters)
+    """
+    objects = layout.get("objects", [])
+    height = float(layout.get("bb", "0,0,0,0").split(",")[3])
+    clusters = sorted((o for o in objects if is_cluster(o)), key=lambda o: -len(o["nodes"]))
+
+    owner: dict[int, dict] = {}
+    collapsed = []
+    for cluster in clusters:
+        if len(cluster["nodes"]) > threshold and not any(n in owner for n in cluster["nodes"]):
+            collapsed.append(cluster)
+            owner.update({n: cluster for n in cluster["nodes"]})
+    collapsed_ids = {c["_gvid"] for c in collapsed}
+
+    def page_id(cluster: dict) -> str:
+        return f"{name}-c{cluster['_gvid']}"
+
+    def summary_id(gvid: int) -> str:
+        return f"c{owner[gvid]['_gvid']}" if gvid in owner else f"n{gvid}"
+
+    def overview():
+        flip = make_flip(height)
+        for obj in clusters:
+            if obj["_gvid"] in collapsed_ids:
+                label = parse_label(obj, "") or obj["name"]
+                yield cluster_cell(obj, flip, f"c{obj['_gvid']}", f"{label} ({len(obj['nodes'])} nodes)",
+                                   f"data:page/id,{page_id(obj)}")
+            elif not any(n in owner for n in obj["nodes"]):
+                yield cluster_cell(obj, flip, f"c{obj['_gvid']}")
+        for obj in objects:
+            if "pos" in obj and obj["_gvid"] not in owner:
+                yield node_cell(obj, flip)
+        merged: dict[tuple[str, str], list[dict]] = {}
+        for edge in layout.get("edges", []):
+            source, target = summary_id(edge["tail"]), summary_id(edge["head"])
+            if edge["tail"] in owner or edge["head"] in owner:
+                if source != target:
+                    merged.setdefault((source, target), []).append(edge)
+            else:
+                yield edge_cell(edge, flip, source, target)
+        for (source, target), edges in merged.items():
+            value = None if len(edges) == 1 else f"{len(edges)} edges"
+            yield edge_cell(edges[0], flip, source, target, routed=False, value=value)
+
+    def drill_down(cluster: dict):
+        x0, _, _, y1 = map(float, cluster["bb"].split(","))
+        flip = make_flip(height, x0, height - y1)
+        members = set(cluster["nodes"])
+        yield cluster_cell(cluster, flip, f"c{cluster['_gvid']}")
+        for obj in clusters:
+            if obj is not cluster and set(obj["nodes"]) <= members:
+                yield cluster_cell(obj, flip, f"c{obj['_gvid']}")
+        for gvid in cluster["nodes"]:
+            yield node_cell(objects[gvid], flip)
+        for edge in layout.get("edges", []):
+            if edge["tail"] in members and edge["head"] in members:
+                yield edge_cell(edge, flip, f"n{edge['tail']}", f"n{edge['head']}")
+
+    pages = [(name, name, overview())]
+    pages += [(page_id(c), parse_label(c, "") or c["name"], drill_down(c)) for c in collapsed]
+    return pages, len(collapsed)
+
+
+def cell_xml(attrs: dict, geometry: dict, points: list | None) -> str:
+    """Serialize one cell, wrapping linked vertices in a UserObject as draw.io does."""
+    geom_attrs = "".join(f" {k}={quoteattr(str(v))}" for k, v in geometry.items())
+    inner = ""
+    if points:
+        inner = '<Array as="points">' + "".join(f'<mxPoint x="{x}" y="{y}"/>' for x, y in points) + "</Array>"
+    geom = f'<mxGeometry{geom_attrs} as="geometry"' + (f">{inner}</mxGeometry>" if inner else "/>")
+    if "link" in attrs:
+        attrs = dict(attrs)
+        outer = {"label": attrs.pop("value"), "link": attrs.pop("link"), "id": attrs.pop("id")}
+        cell_attrs = "".join(f" {k}={quoteattr(str(v))}" for k, v in attrs.items())
+        outer_attrs = "".join(f" {k}={quoteattr(str(v))}" for k, v in outer.items())
+        return f"<UserObject{outer_attrs}><mxCell{cell_attrs}>{geom}</mxCell></UserObject>\n"
+    cell_attrs = "".join(f" {k}={quoteattr(str(v))}" for k, v in attrs.items())
+    return f"<mxCell{cell_attrs}>{geom}</mxCell>\n"
+
+
+def write_mxgraph(xml_file: Path, pages: list) -> int:
+    """
+    Stream an mxfile document to disk one cell at a time.
+
+    Args:
+        xml_file: Destination .xml file
+        pages: (page_id, page_name, cells) tuples; cells may be a generator
+
+    Returns:
+        Number of cells written
+    """
+    count = 0
+    with open(xml_file, "w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n<mxfile host="convert_to_lucid">\n')
+        for pid, page_name, cells in pages:
+            f.write(f"<diagram id={quoteattr(pid)} name={quoteattr(page_name)}><mxGraphModel><root>\n")
+            f.write('<mxCell id="0"/><mxCell id="1" parent="0"/>\n')
+            for cell in cells:
+                f.write(cell_xml(*cell))
+                count += 1
+            f.write("</root></mxGraphModel></diagram>\n")
+        f.write("</mxfile>\n")
+    return count
+
+
+def peak_memory_mb() -> float | None:
+    """Peak resident memory of this process, where the platform reports it."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def convert_dot_single_layout(input_path: str, output_path: str = None, png: bool = True,
+                              collapse_threshold: int = None) -> list[str]:
+    """
+    Convert a DOT file to Lucid Chart XML and PNG from a single Graphviz layout.
+
+    Args:
+        input_path: Path to the .dot file
+        output_path: Optional path for output .xml file
+        png: Whether to render the PNG from the same layout
+        collapse_threshold: Large-graph mode; collapse clusters with more nodes
+            than this into summary nodes with drill-down pages, and report
+            memory and output size
+
+    Returns:
+        Paths of the generated files
+    """
+    input_file = Path(input_path)
+
+    if not input_file.exists():
+        raise FileNotFoundError(f"Input file not found: {input_path}")
+
+    if not input_file.suffix.lower() in DOT_SUFFIXES:
+        raise ValueError(f"Expected .dot or .gv file, got: {input_file.suffix}")
+
+    xml_file = Path(output_path) if output_path else input_file.with_suffix(".xml")
+    png_file = input_file.with_suffix(".png") if png else None
+    xml_file.parent.mkdir(parents=True, exist_ok=True)
+
+    layout = layout_dot(str(input_file), str(png_file) if png_file else None)
+    name = input_file.stem
+    if collapse_threshold is None:
+        pages, collapsed = [(name, name, layout_cells(layout))], 0
+    else:
+        pages, collapsed = collapsed_pages(layout, name, collapse_threshold)
+    cells = write_mxgraph(xml_file, pages)
+    print(f"Successfully converted: {input_file} -> {xml_file}")
+    if png_file:
+        print(f"Successfully generated PNG: {png_file}")
+    if collapse_threshold is not None:
+        nodes = sum(1 for o in layout.get("objects", []) if "pos" in o)
+        print(f"  {nodes} node(s), {len(layout.get('edges', []))} edge(s) -> {cells} cell(s) on {len(pages)} page(s), "
+              f"{collapsed} cluster(s) collapsed")
+        print(f"  XML size: {xml_file.stat().st_size / 1024:.1f} KiB")
+    return [str(xml_file)] + ([str(png_file)] if png_file else [])
+
+
+def collect_inputs(paths: list[str]) -> list[Path]:
+    """
+    Expand files and directories into a sorted list of DOT files.
+
+    Args:
+        paths: Files or directories given on the command line
+
+    Returns:
+        Unique DOT file paths, directories searched recursively
+    """
+    found = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            found.extend(p for p in path.rglob("*") if p.suffix.lower() in DOT_SUFFIXES and p.is_file())
+        else:
+            found.append(path)
+    return sorted(set(found))
+
+
+def content_hash(input_file: Path, mode: str) -> str:
+    """Hash the DOT source together with the conversion mode."""
+    digest = hashlib.sha256(input_file.read_bytes())
+    digest.update(mode.encode())
+    return digest.hexdigest()
+
+
+def load_cache(directory: Path) -> dict:
+    try:
+        return json.loads((directory / CACHE_NAME).read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_cache(directory: Path, cache: dict) -> None:
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".lucid-cache-")
+    with os.fdopen(fd, "w") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    os.replace(tmp, directory / CACHE_NAME)
+
+
+def is_cached(input_file: Path, cache: dict, digest: str) -> bool:
+    """Check the cache entry matches and its outputs still exist."""
+    entry = cache.get(input_file.name)
+    if not entry or entry.get("hash") != digest:
+        return False
+    return all(Path(p).exists() for p in entry.get("outputs", []))
+
+
+def convert_one(input_path: str, output_path: str = None, mode: str = "layout",
+                collapse_threshold: int = None) -> list[str]:
+    """
+    Convert a single DOT file to XML and, where Graphviz is available, PNG.
+
+    Args:
+        input_path: Path to the .dot file
+        output_path: Optional path for output .xml file
+        mode: "layout" (single Graphviz layout), "legacy" (graphviz2drawio + dot -Tpng)
+            or "xml" (graphviz2drawio only)
+        collapse_threshold: Large-graph cluster threshold (layout mode only)
+
+    Returns:
+        Paths of the generated files
+    """
+    if mode == "layout":
+        return convert_dot_single_layout(input_path, output_path, collapse_threshold=collapse_threshold)
+    outputs = [convert_dot_to_xml(input_path, output_path)]
+    if mode == "legacy":
+        outputs.append(convert_dot_to_png(input_path))
+    return outputs
+
+
+def convert_batch(inputs: list[Path], mode: str, jobs: int = None, force: bool = False,
+                  collapse_threshold: int = None) -> tuple[int, int, int]:
+    """
+    Convert many DOT files in parallel, skipping unchanged inputs.
+
+    Args:
+        inputs: DOT files to convert
+        mode: Conversion mode passed to convert_one
+        jobs: Maximum worker processes (defaults to CPU count)
+        force: Ignore the cache and convert everything
+        collapse_threshold: Large-graph cluster threshold passed to convert_one
+
+    Returns:
+        Counts of (converted, skipped, failed) inputs
+    """
+    caches = {d: load_cache(d) for d in {p.parent for p in inputs}}
+    variant = mode if collapse_threshold is None else f"{mode}:collapse={collapse_threshold}"
+    pending = {}
+    skipped = failed = 0
+    for input_file in inputs:
+        try:
+            digest = content_hash(input_file, variant)
+        except OSError as e:
+            print(f"Error: {input_file}: {e}")
+            failed += 1
+            continue
+        if not force and is_cached(input_file, caches[input_file.parent], digest):
+            skipped += 1
+        else:
+            pending[input_file] = digest
+
+    converted = 0
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {f: pool.submit(convert_one, str(f), None, mode, collapse_threshold) for f in pending}
+            for input_file, future in futures.items():
+                try:
+                    outputs = future.result()
+                except Exception as e:
+                    print(f"Error: {input_file}: {e}")
+                    caches[input_file.parent].pop(input_file.name, None)
+                    failed += 1
+                    continue
+                caches[input_file.parent][input_file.name] = {"hash": pending[input_file], "outputs": [str(Path(p).resolve()) for p in outputs]}
+                converted += 1
+
+    for directory, cache in caches.items():
+        save_cache(directory, cache)
+    return converted, skipped, failed
+
+
 def main():
-    if len(sys.argv) < 2:
-        print(__doc__)
+    parser = argparse.ArgumentParser(
+        description="Convert Graphviz DOT files to Lucid Chart XML and PNG",
+        usage="%(prog)s <input.dot> [output.xml] | <input.dot|directory> ... [--jobs N] [--force]",
+    )
+    parser.add_argument("inputs", nargs="+", help="DOT files or directories (or a single input and output path)")
+    parser.add_argument("--output", "-o", help="XML output path for a single input")
+    parser.add_argument("--jobs", "-j", type=int, help="Parallel conversions in batch mode (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Reconvert inputs even if unchanged")
+    parser.add_argument("--legacy", action="store_true", help="Convert with graphviz2drawio and a separate PNG layout")
+    parser.add_argument("--large", action="store_true",
+                        help="Large-graph mode: collapse big clusters into drill-down pages and report memory/size")
+    parser.add_argument("--collapse-threshold", type=int, metavar="N",
+                        help="Collapse clusters with more than N nodes (implies --large, default 100)")
+    args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    collapse_threshold = args.collapse_threshold
+    if args.large and collapse_threshold is None:
+        collapse_threshold = 100
+    if collapse_threshold is not None and args.legacy:
+        print("Error: --large/--collapse-threshold cannot be combined with --legacy")
         sys.exit(1)
 
-    input_path = sys.argv[1]
-    output_path = sys.argv[2] if len(sys.argv) > 2 else None
-
-    # Check graphviz2drawio dependency
-    if not check_dependencies():
-        print("Error: graphviz2drawio not found.")
-        print("Please install it with: pip install graphviz2drawio")
+    inputs = args.inputs
+    output_path = args.output
+    # Legacy form: a second argument that is not a DOT file or directory is the output path
+    if output_path is None and len(inputs) == 2:
+        second = Path(inputs[1])
+        if second.suffix.lower() not in DOT_SUFFIXES and not second.is_dir():
+            inputs, output_path = inputs[:1], inputs[1]
+    if output_path is not None and (len(inputs) > 1 or Path(inputs[0]).is_dir()):
+        print("Error: an output path can only be given for a single input file")
         sys.exit(1)
+    batch = output_path is None and (len(inputs) > 1 or Path(inputs[0]).is_dir())
 
-    # Check Graphviz for PNG generation
+    # Prefer the single-layout pipeline; graphviz2drawio is only needed without Graphviz or with --legacy
     has_graphviz = check_graphviz()
-    if not has_graphviz:
+    if has_graphviz and not args.legacy:
+        mode = "layout"
+    elif not check_dependencies():
+        if has_graphviz:
+            print("Error: graphviz2drawio not found (required by --legacy).")
+            print("Please install it with: pip install graphviz2drawio")
+        else:
+            print("Error: Graphviz not found.")
+            print("Install with: brew install graphviz (macOS) or apt install graphviz (Linux)")
+        sys.exit(1)
+    elif has_graphviz:
+        mode = "legacy"
+    else:
+        mode = "xml"
         print("Warning: Graphviz not found. PNG generation will be skipped.")
         print("Install with: brew install graphviz (macOS) or apt install graphviz (Linux)")
 
+    if batch:
+        files = collect_inputs(inputs)
+        if not files:
+            print("Error: no .dot or .gv files found")
+            sys.exit(1)
+        converted, skipped, failed = convert_batch(files, mode, args.jobs, args.force, collapse_threshold)
+        print(f"\n{len(files)} input(s): {converted} converted, {skipped} unchanged, {failed} failed")
+        if failed:
+            sys.exit(1)
+        return
+
+    input_path = inputs[0]
+
     try:
-        # Generate XML for Lucid Chart
-        xml_result = convert_dot_to_xml(input_path, output_path)
+        # Generate XML for Lucid Chart, plus PNG if Graphviz is available
+        outputs = convert_one(input_path, output_path, mode, collapse_threshold)
+        xml_result, png_result = outputs[0], outputs[1] if len(outputs) > 1 else None
+        # Only meaningful here: batch workers are reused across files
+        peak = peak_memory_mb() if collapse_threshold is not None else None
+        if peak is not None:
+            print(f"  Peak memory: {peak:.1f} MiB")
         print(f"\nXML output: {xml_result}")
-
-        # Generate PNG if Graphviz is available
-        png_result = None
-        if has_graphviz:
-            png_result = convert_dot_to_png(input_path)
+        if png_result:
             print(f"PNG output: {png_result}")
 
         print("\nTo import into Lucid Chart:")
@@ -141,33 +141,35 @@ discover_and_install_plugins() {
   local marketplace_name plugin_count
   local succeeded=0 failed=0
 
-  marketplace_name=$(jq -r '.name' "$marketplace_json")
-  plugin_count=$(jq -r '.plugins | length' "$marketplace_json")
+  local plugins
+  # One jq pass: marketplace name on the first line, then "name<TAB>description" per plugin
+  plugins=$(jq -r '.name, (.plugins[] | [.name, .description] | @tsv)' "$marketplace_json")
+  marketplace_name=$(head -1 <<< "$plugins")
+  plugins=$(tail -n +2 <<< "$plugins")
+  plugin_count=$(grep -c . <<< "$plugins" || true)
 
   echo "Found $plugin_count plugin(s) in marketplace:"
   echo ""
 
   # List all plugins before installing
-  for i in $(seq 0 $((plugin_count - 1))); do
-    local name description
-    name=$(jq -r ".plugins[$i].name" "$marketplace_json")
-    description=$(jq -r ".plugins[$i].description" "$marketplace_json")
+  local name description
+  while IFS=$'\t' read -r name description; do
+    [ -n "$name" ] || continue
     echo "  - $name"
     echo "    $description"
-  done
+  done <<< "$plugins"
 
   echo ""
   echo "Installing plugins..."
   echo ""
 
   # Install each plugin
-  for i in $(seq 0 $((plugin_count - 1))); do
-    local name
-    name=$(jq -r ".plugins[$i].name" "$marketplace_json")
+  while IFS=$'\t' read -r name description; do
+    [ -n "$name" ] || continue
 
     echo -n "  Installing $name... "
 
-    if claude plugin install "${name}@${marketplace_name}" 2>/dev/null; then
+    if claude plugin install "${name}@${marketplace_name}" 2>/dev/null < /dev/null; then
       echo "OK"
       succeeded=$((succeeded + 1))
     else
@@ -176,7 +178,7 @@ discover_and_install_plugins() {
       echo "    claude plugin install ${name}@${marketplace_name}"
       failed=$((failed + 1))
     fi
-  done
+  done <<< "$plugins"
 
   echo ""
   echo "Install results: $succeeded succeeded, $failed failed (of $plugin_count total)"
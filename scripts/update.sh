@@ -7,11 +7,28 @@ set -euo pipefail
 # Safe to run inside a Claude Code session (no `claude` CLI commands).
 # Pulls latest changes and shows a changelog. If new plugins were added,
 # prints the install.sh command for the user to run in an external terminal.
+#
+# With Python 3.10+ available, the changelog lists exactly which plugins and
+# skills changed by comparing content hashes in the catalog index
+# (evals/src/skill_evals/catalog.py) built before and after the pull.
 # ==============================================================================
 
+# ---------------------------------------------------------------------------
+# catalog — Run the catalog index tool from the install directory
+# ---------------------------------------------------------------------------
+catalog() {
+  PYTHONPATH="$INSTALL_DIR/evals/src${PYTHONPATH:+:$PYTHONPATH}" python3 -m skill_evals.catalog "$@"
+}
+
+has_catalog() {
+  command -v python3 &> /dev/null \
+    && python3 -c 'import sys; sys.exit(sys.version_info < (3, 10))' 2>/dev/null \
+    && [ -f "$INSTALL_DIR/evals/src/skill_evals/catalog.py" ]
+}
+
 main() {
   local ORG_SLUG="{{ORG_SLUG}}"
-  local INSTALL_DIR="$HOME/.claude-skills/${ORG_SLUG}"
+  INSTALL_DIR="$HOME/.claude-skills/${ORG_SLUG}"
   local MARKETPLACE_JSON="$INSTALL_DIR/.claude-plugin/marketplace.json"
 
   # -------------------------------------------------------------------------
@@ -43,8 +60,16 @@ main() {
   local OLD_HEAD
   OLD_HEAD=$(git rev-parse HEAD)
 
-  local OLD_PLUGINS
-  OLD_PLUGINS=$(jq -r '.plugins[].name' "$MARKETPLACE_JSON" | sort)
+  local OLD_CATALOG="" OLD_PLUGINS=""
+  if has_catalog; then
+    OLD_CATALOG=$(mktemp)
+    trap "rm -f '$OLD_CATALOG'" EXIT
+    [ -f "$INSTALL_DIR/.skill-catalog.json" ] && cp "$INSTALL_DIR/.skill-catalog.json" "$OLD_CATALOG"
+    catalog build --repo-root "$INSTALL_DIR" --output "$OLD_CATALOG" > /dev/null || OLD_CATALOG=""
+  fi
+  if [ -z "$OLD_CATALOG" ]; then
+    OLD_PLUGINS=$(jq -r '.plugins[].name' "$MARKETPLACE_JSON" | sort)
+  fi
 
   # -------------------------------------------------------------------------
   # Pull latest changes
@@ -68,19 +93,26 @@ main() {
 
   echo "Updated from ${OLD_HEAD:0:7} to ${NEW_HEAD:0:7}."
   echo ""
-  echo "Changelog:"
-  git log --oneline "$OLD_HEAD..$NEW_HEAD"
-  echo ""
-
-  # -------------------------------------------------------------------------
-  # Check for new plugins
-  # -------------------------------------------------------------------------
+  local ADDED_PLUGINS
+  if [ -n "$OLD_CATALOG" ] && has_catalog && catalog build --repo-root "$INSTALL_DIR" > /dev/null; then
+    echo "Changes:"
+    catalog diff "$OLD_CATALOG" "$INSTALL_DIR/.skill-catalog.json" | sed 's/^/  /'
+    echo ""
+    ADDED_PLUGINS=$(catalog diff --added-plugins "$OLD_CATALOG" "$INSTALL_DIR/.skill-catalog.json")
+  else
+    echo "Changelog:"
+    git log --oneline "$OLD_HEAD..$NEW_HEAD"
+    echo ""
 
-  local NEW_PLUGINS
-  NEW_PLUGINS=$(jq -r '.plugins[].name' "$MARKETPLACE_JSON" | sort)
+    # -----------------------------------------------------------------------
+    # Check for new plugins
+    # -----------------------------------------------------------------------
 
-  local ADDED_PLUGINS
-  ADDED_PLUGINS=$(comm -13 <(echo "$OLD_PLUGINS") <(echo "$NEW_PLUGINS"))
+    [ -n "$OLD_PLUGINS" ] || OLD_PLUGINS=$(git show "$OLD_HEAD:.claude-plugin/marketplace.json" | jq -r '.plugins[].name' | sort)
+    local NEW_PLUGINS
+    NEW_PLUGINS=$(jq -r '.plugins[].name' "$MARKETPLACE_JSON" | sort)
+    ADDED_PLUGINS=$(comm -13 <(echo "$OLD_PLUGINS") <(echo "$NEW_PLUGINS"))
+  fi
 
   if [ -n "$ADDED_PLUGINS" ]; then
     echo "=========================================="
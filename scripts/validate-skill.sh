@@ -9,11 +9,44 @@ set -euo pipefail
 #   bash scripts/validate-skill.sh plugins/internal-skills/skills/my-skill  # Validate one skill
 #   bash scripts/validate-skill.sh plugins/*/skills/my-skill                # Validate across plugins
 #
+#   bash scripts/validate-skill.sh --all --json                             # Machine-readable report
+#
+# Delegates to the parallel, cached Python validator (evals/src/skill_evals/validate.py)
+# when Python 3.10+ is available, and falls back to the checks below otherwise.
+# Both run the same per-skill checks on the same plugins/*/skills/*/ directories.
+# Only the Python validator also cross-checks marketplace.json against each
+# plugin.json (with --all) and supports --json, --no-cache and -j/--parallel.
+#
 # Exit codes:
 #   0 — All validations passed
 #   1 — One or more errors found
 # ==============================================================================
 
+REPO_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+
+ALL=false
+for arg in "$@"; do
+  [ "$arg" = "--all" ] && ALL=true
+done
+
+if command -v python3 &> /dev/null && python3 -c 'import sys; sys.exit(sys.version_info < (3, 10))' 2>/dev/null; then
+  if [ "$ALL" = true ]; then
+    cd "$REPO_ROOT"
+  fi
+  PYTHONPATH="${REPO_ROOT}/evals/src${PYTHONPATH:+:$PYTHONPATH}" \
+    exec python3 -m skill_evals.validate --repo-root "$REPO_ROOT" "$@"
+fi
+
+for arg in "$@"; do
+  case "$arg" in
+    --all) ;;
+    -*)
+      echo "ERROR: ${arg} requires Python 3.10+ (only --all is supported by the shell fallback)"
+      exit 1
+      ;;
+  esac
+done
+
 ERRORS=0
 WARNINGS=0
 
@@ -82,6 +115,8 @@ validate_skill() {
     name_value=$(echo "$frontmatter" | grep "^name:" | head -1 | sed 's/^name:[[:space:]]*//')
     if ! echo "$name_value" | grep -qE '^[a-z0-9]+(-[a-z0-9]+)*$'; then
       error "'name' must be kebab-case in ${skill_file} (got: ${name_value})"
+    elif [ "$name_value" != "$skill_name" ]; then
+      warn "'name' (${name_value}) does not match directory name in ${skill_dir}/"
     fi
   fi
 
@@ -96,12 +131,18 @@ validate_skill() {
 
   # Count non-frontmatter lines (everything after the closing --- of frontmatter)
   local body_lines
-  body_lines=$(awk 'BEGIN{found=0} /^---$/{found++; next} found>=2{print}' "$skill_file" | wc -l | tr -d ' ')
+  body_lines=$(awk 'BEGIN{found=0} found>=2{print; next} /^---$/{found++}' "$skill_file" | wc -l | tr -d ' ')
 
   if [ "$body_lines" -lt 10 ]; then
     warn "SKILL.md body is very short (${body_lines} lines) in ${skill_dir}/ — consider adding more detail"
   fi
 
+  local total_lines
+  total_lines=$(wc -l < "$skill_file" | tr -d ' ')
+  if [ "$total_lines" -gt 500 ]; then
+    warn "SKILL.md is ${total_lines} lines in ${skill_dir}/ — move detail to references/"
+  fi
+
   # -------------------------------------------------------------------------
   # Check scripts are executable (if scripts/ directory exists)
   # -------------------------------------------------------------------------
@@ -131,8 +172,9 @@ echo ""
 # Determine which skills to validate
 SKILL_DIRS=()
 
-if [ "${1:-}" = "--all" ]; then
+if [ "$ALL" = true ]; then
   # Validate all skills across all plugins
+  cd "$REPO_ROOT"
   for dir in plugins/*/skills/*/; do
     [ -d "$dir" ] && SKILL_DIRS+=("$dir")
   done